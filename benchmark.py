@@ -0,0 +1,202 @@
+'''
+benchmark suite for permute
+
+    python benchmark.py run [--output FILE] [--repeat N] [--seed S]
+        runs every entry of 'examples' and the families of symmetric,
+        alternating, dihedral and cyclic product groups through conversion,
+        compose, closure, normal closure and quotient construction.
+        time, peak memory and operation counts are written as JSON to FILE
+    python benchmark.py compare OLD NEW [--threshold T] [--min-time M]
+        compares two result files and lists the regressions,
+        the exit code is 1 if there are any
+'''
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+import zlib
+from time import perf_counter
+
+from permute import (p, examples, subgroup, normalizer, quotientgroup, compose,
+    to_image, to_cycle, from_image, from_cycle, measure)
+
+SEED=12345
+FORMAT_VERSION=2
+
+################################################
+#### Group families ############################
+################################################
+
+def symmetric(n):
+    return(("symmetric group S%d"%n,[p(tuple(range(1,n+1))),p((1,2))]))
+
+def alternating(n):
+    return(("alternating group A%d"%n,[p((1,2,k)) for k in range(3,n+1)]))
+
+def dihedral(n):
+    reflection=[(k,n+1-k) for k in range(1,n//2+1)]
+    return(("dihedral group of the %d-gon"%n,[p(tuple(range(1,n+1))),p(*reflection)]))
+
+def cyclic_product(*orders):
+    generators=[]
+    first=1
+    for n in orders:
+        generators.append(p(tuple(range(first,first+n))))
+        first+=n
+    return(("product of cyclic groups %s"%' x '.join('Z%d'%n for n in orders),generators))
+
+def cases():
+    '''
+    returns a dictionary that maps the name of each benchmark case to (description, generators)
+    '''
+    result={}
+    for name,ex in examples.items():
+        result['examples/'+name]=ex
+    for n in (4,5,6):
+        result['S%d'%n]=symmetric(n)
+    for n in (4,5,6):
+        result['A%d'%n]=alternating(n)
+    for n in (5,8,12):
+        result['D%d'%n]=dihedral(n)
+    for orders in ((2,3),(4,6),(3,5,7)):
+        result['Z'+'xZ'.join(map(str,orders))]=cyclic_product(*orders)
+    return(result)
+
+################################################
+#### Operations ################################
+################################################
+
+def ordered(group):
+    # the iteration order of a set of permutations changes from process to process
+    return(sorted(group,key=to_image))
+
+def bench_conversion(generators, group, rng):
+    for g in group:
+        from_image(to_image(g))
+        from_cycle(to_cycle(g))
+
+def bench_compose(generators, group, rng):
+    elements=ordered(group)
+    for _ in range(2000):
+        compose(rng.choice(elements),rng.choice(elements))
+
+def bench_closure(generators, group, rng):
+    subgroup(generators)
+
+def bench_normal_closure(generators, group, rng):
+    normalizer([rng.choice(ordered(group))],group)
+
+def bench_quotient(generators, group, rng):
+    normalgroup=normalizer([rng.choice(ordered(group))],group)
+    quotientgroup(group,normalgroup)
+
+OPERATIONS={
+    'conversion':bench_conversion,
+    'compose':bench_compose,
+    'closure':bench_closure,
+    'normal_closure':bench_normal_closure,
+    'quotient':bench_quotient,
+    }
+
+################################################
+#### Run and compare ###########################
+################################################
+
+def run_operation(func, generators, group, seed, repeat):
+    '''
+    runs func 'repeat' times for the best time,
+    then once more to count the operations and to trace the peak memory
+    '''
+    best=None
+    for _ in range(repeat):
+        random.seed(seed)
+        rng=random.Random(seed)
+        start=perf_counter()
+        func(generators,group,rng)
+        elapsed=perf_counter()-start
+        if best is None or elapsed<best:
+            best=elapsed
+    random.seed(seed)
+    rng=random.Random(seed)
+    tracemalloc.start()
+    try:
+        with measure() as metrics:
+            func(generators,group,rng)
+        peak=tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return({'time':best,'peak_memory':peak,'counts':metrics.counts})
+
+def run(seed=SEED, repeat=3):
+    results={}
+    for name,(description,generators) in sorted(cases().items()):
+        group=subgroup(generators)
+        case={'description':description,'order':len(group),'operations':{}}
+        # the seed of a case depends on its name only, not on the other cases
+        case_seed=seed+zlib.crc32(name.encode())
+        for opname,func in OPERATIONS.items():
+            case['operations'][opname]=run_operation(func,generators,group,case_seed,repeat)
+        results[name]=case
+        print('%-24s %8d elements'%(name,len(group)),file=sys.stderr)
+    return({'version':FORMAT_VERSION,'seed':seed,'repeat':repeat,'python':sys.version.split()[0],'cases':results})
+
+def compare(old, new, threshold=0.2, min_time=0.001):
+    '''
+    returns a list of regressions of 'new' against 'old' as printable lines.
+    a time or peak memory that grew by more than 'threshold' (relative)
+    or an operation count that grew at all is a regression.
+    times below 'min_time' seconds are too noisy to be compared
+    '''
+    regressions=[]
+    for name,case in new['cases'].items():
+        old_case=old['cases'].get(name)
+        if old_case is None:
+            continue
+        for opname,result in case['operations'].items():
+            old_result=old_case['operations'].get(opname)
+            if old_result is None:
+                continue
+            for key in ('time','peak_memory'):
+                if key=='time' and result[key]<min_time:
+                    continue
+                if old_result[key]>0 and result[key]>old_result[key]*(1+threshold):
+                    regressions.append('%s %s: %s %.6g -> %.6g (%+.0f%%)'%(name,opname,key,
+                        old_result[key],result[key],100*(result[key]/old_result[key]-1)))
+            for counter,count in result['counts'].items():
+                old_count=old_result['counts'].get(counter,0)
+                if count>old_count:
+                    regressions.append('%s %s: %s calls %d -> %d'%(name,opname,counter,old_count,count))
+    return(regressions)
+
+def cli(argv=None):
+    parser=argparse.ArgumentParser(description="benchmark suite for permute")
+    commands=parser.add_subparsers(dest='command',required=True)
+    run_parser=commands.add_parser('run',help="run the benchmarks")
+    run_parser.add_argument('--output',default='benchmark.json',help="result file (default benchmark.json)")
+    run_parser.add_argument('--repeat',type=int,default=3,help="timing runs per operation, the best is kept")
+    run_parser.add_argument('--seed',type=int,default=SEED)
+    compare_parser=commands.add_parser('compare',help="compare two result files")
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold',type=float,default=0.2,
+        help="relative growth of time or memory that counts as regression (default 0.2)")
+    compare_parser.add_argument('--min-time',type=float,default=0.001,
+        help="times below this many seconds are not compared (default 0.001)")
+    args=parser.parse_args(argv)
+    if args.command=='run':
+        results=run(args.seed,args.repeat)
+        with open(args.output,'w') as f:
+            json.dump(results,f,indent=1,sort_keys=True)
+        return(0)
+    with open(args.old) as f:
+        old=json.load(f)
+    with open(args.new) as f:
+        new=json.load(f)
+    regressions=compare(old,new,args.threshold,args.min_time)
+    for line in regressions:
+        print(line)
+    return(1 if regressions else 0)
+
+if __name__=='__main__':
+    sys.exit(cli())
@@ -0,0 +1,86 @@
+'''
+permute - calculate with permutations and permutation groups
+
+importing the package does no calculations, the 'examples' catalogue
+is built on first access
+'''
+
+from .errors import (Error, InputError, DuplicateElement, MissingElement, NoElementList, InvalidItem,
+    InvalidFile)
+from .permutation import TYPECODE, Permutation, from_image, from_cycle, to_cycle, to_image
+from .instrument import Metrics, measure, instrumented
+from .validate import (check_imagelist, check_cyclelist, to_permutation, parse_permutation,
+    iter_parse, parse_many)
+from .arithmetic import (identity, compose, invert, commutator, orderof, powerof, powers,
+    enable_memo, disable_memo, memo_clear, memo_info)
+from .batch import (require_numpy, have_numpy, batch_degree, to_batch, from_batch,
+    batch_compose, batch_invert, batch_conjugate, row_keys, batch_unique, batch_isin)
+from .ranking import (rank, unrank, rank_many, unrank_many, batch_rank, batch_unrank,
+    BitsetGroup, bitset_subgroup)
+from .cayley import CayleyTable
+from .cosets import CosetTable
+from .storage import save_group, load_group, StoredGroup
+from .table import gen_itemnames1, print_group1, describe_group1
+from .interpreter import (extract_integer, print_error, compile_expression, evaluate,
+    calc_expression, set_product, calc_sets, swap_symbols, execute_command, interpreter)
+from .script import setup, run_script
+from .groups import (subgroup, iter_subgroup, find_element, subgroupX,
+    extend_subgroup, normal_closure, commutator_subgroup, derived_series,
+    lower_central_series, is_solvable, is_nilpotent, normalizer, commutator_set, quotientgroup)
+from .centralizers import centralizer, element_centralizer, centre
+from .orbits import (schreier_vector, trace, orbit, orbit_transversal, stabilizer,
+    orbit_partition)
+from .invariants import (order_histogram, cycle_type_histogram, elements_of_order,
+    elements_of_cycle_type)
+from .conjugacy import (conjugacy_classes, class_symbols, symmetric_group_kind,
+    class_representatives)
+from .sampling import (ProductReplacement, random_elements, estimate_order_distribution,
+    estimate_cycle_types, probable_symmetric_group_kind)
+from .schreier import StabilizerChain, LazyGroup
+from .parallel import parallel_subgroup
+
+p=to_permutation
+
+o=compose
+i=invert
+e=powerof
+
+__all__=[
+    'Error', 'InputError', 'DuplicateElement', 'MissingElement', 'NoElementList', 'InvalidItem',
+    'InvalidFile',
+    'TYPECODE', 'Permutation', 'from_image', 'from_cycle', 'to_cycle', 'to_image',
+    'Metrics', 'measure', 'instrumented',
+    'check_imagelist', 'check_cyclelist', 'to_permutation', 'parse_permutation',
+    'iter_parse', 'parse_many',
+    'identity', 'compose', 'invert', 'commutator', 'orderof', 'powerof', 'powers',
+    'enable_memo', 'disable_memo', 'memo_clear', 'memo_info',
+    'require_numpy', 'have_numpy', 'batch_degree', 'to_batch', 'from_batch',
+    'batch_compose', 'batch_invert', 'batch_conjugate', 'row_keys', 'batch_unique', 'batch_isin',
+    'rank', 'unrank', 'rank_many', 'unrank_many', 'batch_rank', 'batch_unrank',
+    'BitsetGroup', 'bitset_subgroup',
+    'CayleyTable', 'CosetTable', 'save_group', 'load_group', 'StoredGroup',
+    'gen_itemnames1', 'print_group1', 'describe_group1',
+    'extract_integer', 'print_error', 'compile_expression', 'evaluate', 'calc_expression', 'set_product', 'calc_sets',
+    'swap_symbols', 'execute_command', 'interpreter', 'setup', 'run_script',
+    'subgroup', 'iter_subgroup', 'find_element', 'subgroupX',
+    'extend_subgroup', 'normal_closure', 'commutator_subgroup', 'derived_series',
+    'lower_central_series', 'is_solvable', 'is_nilpotent', 'normalizer', 'commutator_set', 'quotientgroup',
+    'centralizer', 'element_centralizer', 'centre',
+    'schreier_vector', 'trace', 'orbit', 'orbit_transversal', 'stabilizer', 'orbit_partition',
+    'order_histogram', 'cycle_type_histogram', 'elements_of_order', 'elements_of_cycle_type',
+    'conjugacy_classes', 'class_symbols', 'symmetric_group_kind', 'class_representatives',
+    'ProductReplacement', 'random_elements', 'estimate_order_distribution',
+    'estimate_cycle_types', 'probable_symmetric_group_kind',
+    'StabilizerChain', 'LazyGroup',
+    'parallel_subgroup',
+    'p', 'o', 'i', 'e',
+    ]
+
+def __getattr__(name):
+    # the examples catalogue is built on first access
+    if name=='examples':
+        from .catalogue import build_examples
+        global examples
+        examples=build_examples()
+        return(examples)
+    raise AttributeError("module %r has no attribute %r"%(__name__,name))
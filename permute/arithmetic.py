@@ -0,0 +1,131 @@
+'''
+operations and calculations on permutations
+'''
+
+from functools import lru_cache
+
+from .instrument import instrumented
+from .permutation import Permutation
+
+################################################
+#### Operation and Calculations ################
+#### depending of internal representation ######
+################################################
+
+# the identity is kept alive, so identity() always returns the same object
+_identity=Permutation()
+
+def identity():
+    ''' 
+    returns the identity permutation
+    '''
+    return(_identity)
+
+@instrumented('compose')
+def compose(perm1, perm2):
+    '''
+    compose(perm1,perm2) calculates perm1 * perm2,
+    (perm1 * perm2)(x)=(perm1(perm2(x))), forall x
+    '''
+    if _memo is not None:
+        return _memo['compose'](perm1,perm2)
+    return perm1*perm2
+    
+@instrumented('invert')
+def invert(perm):
+    if _memo is not None:
+        return _memo['invert'](perm)
+    return (~perm)
+
+################################################
+#### Operation and Calculations ################
+#### independing of internal representation ####
+################################################
+
+
+def orderof(perm):
+    '''
+    returns the order of a permutation
+    '''
+    return perm.order
+
+def commutator(perm1, perm2):
+    '''
+    returns the commutator [perm1,perm2]=perm1*perm2*perm1^-1*perm2^-1
+    '''
+    return(compose(compose(perm1,perm2),compose(invert(perm1),invert(perm2))))
+
+@instrumented('powerof')
+def powerof(perm,n):
+    ''' 
+    input:
+        'perm': 
+            a permutation (internal representation)
+        'n': 
+            an integer
+    output:
+        return: 
+            the permutation perm raised to the n-th power
+    '''
+    if _memo is not None:
+        return _memo['powerof'](perm,n)
+    return(perm**n)
+
+@instrumented('powers')
+def powers(perm):
+    '''
+    input:
+        'perm':
+            a permutation (internal representation)
+    output:
+        return:
+            the list of the elements of the cyclic group generated by perm,
+            perm^0,...,perm^(m-1) where m is the order of perm
+    '''
+    return(perm.powers())
+
+
+################################################
+#### Memoization ###############################
+################################################
+
+# the caches of compose, invert and powerof, None if memoization is disabled
+_memo=None
+
+def enable_memo(maxsize=65536):
+    '''
+    memoize the results of compose, invert and powerof.
+    each operation keeps at most 'maxsize' results, the least recently used are evicted.
+    enabling again starts with empty caches
+    '''
+    global _memo
+    _memo={
+        'compose':lru_cache(maxsize)(lambda perm1,perm2: perm1*perm2),
+        'invert':lru_cache(maxsize)(lambda perm: ~perm),
+        'powerof':lru_cache(maxsize)(lambda perm,n: perm**n),
+        }
+
+def disable_memo():
+    '''
+    stop memoizing and release the caches
+    '''
+    global _memo
+    _memo=None
+
+def memo_clear():
+    '''
+    empty the caches and reset their statistics
+    '''
+    if _memo is not None:
+        for cached in _memo.values():
+            cached.cache_clear()
+
+def memo_info():
+    '''
+    returns a dictionary that maps 'compose', 'invert' and 'powerof'
+    to the hits, misses, maxsize and currsize of their cache,
+    empty if memoization is disabled
+    '''
+    if _memo is None:
+        return {}
+    return {name:cached.cache_info()._asdict() for name,cached in _memo.items()}
@@ -0,0 +1,151 @@
+'''
+batched operations on many permutations at once, numpy is needed
+'''
+
+from .permutation import Permutation
+
+# numpy is imported on first use, so that importing this module is cheap
+np=None
+
+# a batch is a 2-D numpy array, each row holds the 0-based images
+# of 0,...,degree-1 of one permutation, all rows have the same degree
+
+def require_numpy():
+    '''
+    imports numpy on first use and returns it.
+    raises ImportError if numpy is not installed
+    '''
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for batched operations") from None
+        np=numpy
+    return(np)
+
+def have_numpy():
+    '''
+    returns True if numpy is installed
+    '''
+    try:
+        require_numpy()
+    except ImportError:
+        return(False)
+    return(True)
+
+def batch_degree(*perms):
+    '''
+    returns the smallest degree a batch of all permutations in the iterables 'perms' can have
+    '''
+    return(max((g.degree for group in perms for g in group),default=0))
+
+def to_batch(perms, degree=None):
+    '''
+    converts an iterable of permutations to a batch
+    '''
+    require_numpy()
+    perms=list(perms)
+    if degree is None:
+        degree=batch_degree(perms)
+    batch=np.tile(np.arange(degree,dtype=np.uint32),(len(perms),1))
+    for k,g in enumerate(perms):
+        batch[k,:g.degree]=np.frombuffer(g._images,dtype=np.uint32)
+    return(batch)
+
+def from_batch(batch):
+    '''
+    converts a batch to a list of permutations
+    '''
+    return([Permutation(row) for row in batch.tolist()])
+
+def batch_compose(left, right):
+    '''
+    composes the rows of 'left' with the rows of 'right', left(right(x)).
+    one of them can be a single row (1-D), it is composed with every row of the other.
+    '''
+    require_numpy()
+    left=np.asarray(left)
+    right=np.asarray(right)
+    if left.ndim==1:
+        return(left[right])
+    if right.ndim==1:
+        return(left[:,right])
+    return(np.take_along_axis(left,right,axis=1))
+
+def batch_invert(batch):
+    '''
+    inverts every row of 'batch'
+    '''
+    require_numpy()
+    batch=np.asarray(batch)
+    if batch.ndim==1:
+        return(batch_invert(batch[np.newaxis])[0])
+    result=np.empty_like(batch)
+    points=np.broadcast_to(np.arange(batch.shape[1],dtype=batch.dtype),batch.shape)
+    np.put_along_axis(result,batch.astype(np.intp),points,axis=1)
+    return(result)
+
+def batch_conjugate(batch, conjugator):
+    '''
+    returns conjugator*x*conjugator^-1 for every row x of 'batch'.
+    'conjugator' is a single row or a batch with the same number of rows
+    '''
+    return(batch_compose(batch_compose(conjugator,batch),batch_invert(conjugator)))
+
+# odd multipliers of the row hash, fixed so that keys are reproducible
+_ROW_HASH_MULTIPLIERS={}
+
+def row_keys(batch):
+    '''
+    returns a 64 bit hash key for each row of 'batch'
+    '''
+    require_numpy()
+    degree=batch.shape[1]
+    multipliers=_ROW_HASH_MULTIPLIERS.get(degree)
+    if multipliers is None:
+        rng=np.random.default_rng(degree)
+        multipliers=rng.integers(1,2**63,size=degree,dtype=np.uint64)|np.uint64(1)
+        _ROW_HASH_MULTIPLIERS[degree]=multipliers
+    with np.errstate(over='ignore'):
+        return((batch.astype(np.uint64)*multipliers).sum(axis=1,dtype=np.uint64))
+
+def _exact_unique(batch):
+    rows=np.ascontiguousarray(batch).view(np.dtype((np.void,batch.dtype.itemsize*batch.shape[1])))
+    _,first=np.unique(rows.ravel(),return_index=True)
+    return(batch[np.sort(first)])
+
+def batch_unique(batch):
+    '''
+    removes duplicate rows from 'batch', the first occurence of each row is kept
+    '''
+    if len(batch)==0:
+        return(batch)
+    keys=row_keys(batch)
+    _,first,inverse=np.unique(keys,return_index=True,return_inverse=True)
+    if not (batch==batch[first[inverse.ravel()]]).all():
+        # hash collision, compare the rows
+        return(_exact_unique(batch))
+    return(batch[np.sort(first)])
+
+def batch_isin(batch, group):
+    '''
+    returns a boolean array, True for each row of 'batch' that is a row of the batch 'group'
+    '''
+    require_numpy()
+    if len(group)==0 or len(batch)==0:
+        return(np.zeros(len(batch),dtype=bool))
+    keys=row_keys(batch)
+    group_keys=row_keys(group)
+    sorter=np.argsort(group_keys)
+    sorted_keys=group_keys[sorter]
+    pos=np.minimum(np.searchsorted(sorted_keys,keys),len(group)-1)
+    candidates=sorter[pos]
+    same_key=sorted_keys[pos]==keys
+    found=same_key & (group[candidates]==batch).all(axis=1)
+    collisions=np.flatnonzero(same_key & ~found)
+    if len(collisions):
+        members={row.tobytes() for row in group}
+        for k in collisions:
+            found[k]=batch[k].tobytes() in members
+    return(found)
@@ -0,0 +1,47 @@
+'''
+catalogue of example groups, given by their generators
+'''
+
+from .validate import to_permutation as p
+
+def build_examples():
+    '''
+    returns a dictionary that maps the name of each example to a 2-tuple
+    (description, list of generators)
+    '''
+    examples={}
+
+    examples["Z2"]=("Z modulo 2",
+    [p((1,2))])
+
+    examples["Z3"]=("Z modulo 3",
+    [p((1,2,3))])
+
+    examples["Z4"]=("Z modulo 4",
+    [p((1,2,3,4))])
+
+    examples["Z2xZ2"]=("direct product Z2 x Z2",
+    [p((1,2)),p((3,4))])
+
+    examples["S3"]=("permutations of 3 elements",
+    [p((1,2,3)),p((1,2))])
+
+    examples["R2E3SH"]=("Spiegelungen des gleichseitigen Dreiecks",
+    [p((1,2)),p((1,3)),p((2,3))])
+
+    examples["R2E4SD"]=("Spiegelungen des Quadrats um Diagonale",
+    [p((1,3)),p((2,4))])
+
+    examples["R2E4SdSs"]=("Spiegelungen des Quadrats um Diagonale und Seitenhalbierende",
+    [p((1,3)),p((2,4)),p((1,2),(3,4)),p((1,4),(2,3))])
+
+    examples["R2E4SdSsR4"]=("Spiegelungen des Quadrats um Diagonale und Seitenhalbierende und Drehung um 90 Grad",
+    [p((1,3)),p((2,4)),p((1,2),(3,4)),p((1,4),(2,3)),p((1,2,3,4))])
+
+    examples["R3E4R3"]=("Drehung des Teraeders",
+    [p((1,2,4)),p((2,3,4)),p((1,2,3))])
+
+    examples["R3E8R4"]=("Drehung des Würfels",
+    [p((2,3,4,1),(5,6,7,8)),p((6,7,3,2),(8,4,1,5)),p((1,2,6,5),(7,8,4,3))])
+
+    return(examples)
@@ -0,0 +1,98 @@
+'''
+integer indexed Cayley tables
+'''
+
+from array import array
+
+from .permutation import TYPECODE
+from .arithmetic import identity
+
+################################################
+#### Cayley table ##############################
+################################################
+
+class CayleyTable:
+    '''
+    integer indexed multiplication table of a finite group.
+    'elements' is the list of the group elements, 'index' maps each element
+    to its position in this list. products and inverses of indices are
+    looked up in dense typed arrays.
+    if 'lazy' is True the rows of the multiplication table are calculated
+    and allocated on first use, build() can calculate them in blocks.
+    '''
+
+    def __init__(self, elements, lazy=False):
+        self.elements=list(elements)
+        self.index={g:i for i,g in enumerate(self.elements)}
+        # the rows of the table, None until they are calculated
+        self._rows=[None]*len(self.elements)
+        self.inverse=array(TYPECODE,[self.index[~g] for g in self.elements])
+        if not lazy:
+            self.build()
+
+    def __len__(self):
+        return(len(self.elements))
+
+    def _build_row(self, a):
+        index=self.index
+        ga=self.elements[a]
+        row=array(TYPECODE,[index[ga*g] for g in self.elements])
+        self._rows[a]=row
+        return(row)
+
+    def build(self, start=0, stop=None):
+        '''
+        calculates the rows start,...,stop-1 of the multiplication table
+        '''
+        if stop is None:
+            stop=len(self.elements)
+        for a in range(start,stop):
+            if self._rows[a] is None:
+                self._build_row(a)
+
+    def row(self, a):
+        '''
+        returns the row of index a, the indices of a*b for all indices b.
+        the row is the array of the table, it must not be changed
+        '''
+        row=self._rows[a]
+        if row is None:
+            row=self._build_row(a)
+        return(row)
+
+    def mul(self, a, b):
+        '''
+        returns the index of the product of the elements with index a and b
+        '''
+        row=self._rows[a]
+        if row is None:
+            row=self._build_row(a)
+        return(row[b])
+
+    def pow(self, a, n):
+        '''
+        returns the index of the n-th power of the element with index a
+        '''
+        if n<0:
+            a=self.inverse[a]
+            n=-n
+        result=self.index[identity()]
+        while n:
+            if n&1:
+                result=self.mul(result,a)
+            n>>=1
+            if n:
+                a=self.mul(a,a)
+        return(result)
+
+    def product(self, perm1, perm2):
+        '''
+        the same as compose(perm1,perm2) for elements of the group
+        '''
+        return(self.elements[self.mul(self.index[perm1],self.index[perm2])])
+
+    def power(self, perm, n):
+        '''
+        the same as powerof(perm,n) for elements of the group
+        '''
+        return(self.elements[self.pow(self.index[perm],n)])
@@ -0,0 +1,136 @@
+'''
+centralizers and centre computed by backtrack search in a stabilizer chain
+'''
+
+from .arithmetic import identity, compose
+from .schreier import StabilizerChain, LazyGroup
+
+def _cycle_lengths(perm, points):
+    # the length of the cycle of perm that contains each point
+    lengths={}
+    for point in points:
+        if point in lengths:
+            continue
+        cycle=[point]
+        image=perm(point)
+        while image!=point:
+            cycle.append(image)
+            image=perm(image)
+        for q in cycle:
+            lengths[q]=len(cycle)
+    return(lengths)
+
+def _orbit(point, generators):
+    orbit=set([point])
+    stack=[point]
+    while stack:
+        q=stack.pop()
+        for g in generators:
+            r=g(q)
+            if r not in orbit:
+                orbit.add(r)
+                stack.append(r)
+    return(orbit)
+
+class _Search:
+    # backtrack search for the elements of the group of 'chain' that commute with all of 'elements'
+
+    def __init__(self, chain, elements):
+        self.chain=chain
+        self.elements=list(elements)
+        base=chain.base
+        # a partial element can map a base point to any point its group moves,
+        # so the cycle lengths are needed for all points up to the degree
+        degree=max([g.degree for level in chain.strong_generators for g in level]+
+            [x.degree for x in self.elements],default=0)
+        self.lengths=[_cycle_lengths(x,range(1,degree+1)) for x in self.elements]
+        # pairs[j]: the pairs (m,mx,x) with x(base[m])==base[mx] and max(m,mx)==j
+        position={b:k for k,b in enumerate(base)}
+        self.pairs=[[] for _ in base]
+        for x in self.elements:
+            for m,b in enumerate(base):
+                mx=position.get(x(b))
+                if mx is not None:
+                    self.pairs[max(m,mx)].append((m,mx,x))
+
+    def _possible(self, perm, j):
+        # can an element that agrees with perm on base[0],...,base[j] commute with the elements?
+        base=self.chain.base
+        image=perm(base[j])
+        for lengths in self.lengths:
+            if lengths.get(base[j],1)!=lengths.get(image,1):
+                return(False)
+        for m,mx,x in self.pairs[j]:
+            if perm(base[mx])!=x(perm(base[m])):
+                return(False)
+        return(True)
+
+    def _commutes(self, perm):
+        return(all(compose(perm,x)==compose(x,perm) for x in self.elements))
+
+    def find(self, level, point):
+        '''
+        returns an element that fixes base[0],...,base[level-1], maps base[level]
+        to point and commutes with the elements, None if there is none
+        '''
+        u=self.chain.transversals[level][point]
+        if not self._possible(u,level):
+            return(None)
+        return(self._descend(level+1,u))
+
+    def _descend(self, j, partial):
+        if j==len(self.chain.base):
+            return(partial if self._commutes(partial) else None)
+        for u in self.chain.transversals[j].values():
+            candidate=compose(partial,u)
+            if self._possible(candidate,j):
+                result=self._descend(j+1,candidate)
+                if result is not None:
+                    return(result)
+        return(None)
+
+def centralizer(generators, elements):
+    '''
+    input:
+        'generators':
+            a list of permutations that generate a group G
+        'elements':
+            a list of permutations
+    output:
+        return:
+            the centralizer of elements in G, the elements of G that commute with
+            every permutation in elements, as a LazyGroup
+    the search runs through the stabilizer chain of G from the last level to the first,
+    it looks for one element for each orbit of the part already found, and drops
+    partial elements that do not map cycles of an element onto cycles of equal length
+    '''
+    assert isinstance(generators,(list,set,tuple))
+    chain=StabilizerChain(generators)
+    search=_Search(chain,elements)
+    found=[]
+    for level in range(len(chain.base)-1,-1,-1):
+        point=chain.base[level]
+        orbit=_orbit(point,found)
+        failed=set()
+        for gamma in chain.transversals[level]:
+            if gamma in orbit or gamma in failed:
+                continue
+            g=search.find(level,gamma)
+            if g is None:
+                failed.update(_orbit(gamma,found))
+            else:
+                found.append(g)
+                orbit=_orbit(point,found)
+    return(LazyGroup(found if found else [identity()]))
+
+def element_centralizer(generators, x):
+    '''
+    returns the centralizer of the permutation x in the group generated by 'generators', as a LazyGroup
+    '''
+    return(centralizer(generators,[x]))
+
+def centre(generators):
+    '''
+    returns the centre of the group generated by 'generators', as a LazyGroup
+    '''
+    return(centralizer(generators,list(generators)))
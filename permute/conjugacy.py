@@ -0,0 +1,128 @@
+'''
+conjugacy classes of permutation groups
+'''
+
+from array import array
+from math import factorial
+
+from .permutation import TYPECODE, from_cycle, to_cycle
+from .arithmetic import identity, compose, invert
+from .groups import subgroup
+from .schreier import StabilizerChain
+
+def conjugacy_classes(generators, elementlist=None):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'elementlist':
+            a list of the elements of the group generated by generators,
+            e.g. component 1 of gen_itemnames1, subgroup(generators) is listed if None
+    output:
+        return:
+            a 2-tuple:
+                component 1: elementlist
+                component 2: the list of conjugacy classes, each an array of indices into
+                    elementlist, the class of the identity comes first.
+                    symbol[elementlist[k]] is the symbol of index k for the symbol dictionary of gen_itemnames1
+    each class is the orbit of its first element under conjugation by the generators,
+    a typed array marks the class of every element that has been visited
+    '''
+    assert isinstance(generators,(list,set,tuple))
+    if elementlist is None:
+        elementlist=[identity()]
+        elementlist.extend(g for g in subgroup(generators) if g!=identity())
+    index={g:k for k,g in enumerate(elementlist)}
+    conjugators=[(g,invert(g)) for g in generators]
+    class_of=array(TYPECODE,[0])*len(elementlist)
+    classes=[]
+    for k in range(len(elementlist)):
+        if class_of[k]:
+            continue
+        c=len(classes)+1
+        members=array(TYPECODE,[k])
+        class_of[k]=c
+        n=0
+        while n<len(members):
+            x=elementlist[members[n]]
+            n+=1
+            for g,invg in conjugators:
+                y=index[compose(compose(g,x),invg)]
+                if not class_of[y]:
+                    class_of[y]=c
+                    members.append(y)
+        classes.append(members)
+    return((elementlist,classes))
+
+def class_symbols(elementlist, classes, symbol):
+    '''
+    returns the conjugacy classes of conjugacy_classes as lists of the symbols of gen_itemnames1
+    '''
+    return([[symbol[elementlist[k]] for k in members] for members in classes])
+
+def _partitions(n, largest=None):
+    # the partitions of n into parts of at most 'largest', largest parts first
+    if largest is None:
+        largest=n
+    if n==0:
+        yield ()
+        return
+    for k in range(min(n,largest),0,-1):
+        for rest in _partitions(n-k,k):
+            yield (k,)+rest
+
+def _class_size(n, partition):
+    size=factorial(n)
+    for k in set(partition):
+        m=partition.count(k)
+        size//=k**m*factorial(m)
+    return(size)
+
+def symmetric_group_kind(generators):
+    '''
+    returns ('S',support) if the group generated by 'generators' is the full symmetric group
+    on the points it moves, ('A',support) if it is the alternating group on them,
+    (None,support) otherwise. support is the sorted list of the moved points
+    '''
+    support=sorted(set(q for g in generators for c in to_cycle(g) for q in c))
+    n=len(support)
+    order=StabilizerChain(generators).order()
+    if order==factorial(n):
+        return(('S',support))
+    if n>1 and order==factorial(n)//2:
+        return(('A',support))
+    return((None,support))
+
+def class_representatives(generators):
+    '''
+    returns a list of 2-tuples (representative, size) with one entry per conjugacy class
+    of the group generated by 'generators'.
+    for symmetric and alternating groups the classes are read off the cycle types
+    without listing the group, otherwise conjugacy_classes is used
+    '''
+    kind,support=symmetric_group_kind(generators)
+    if kind is None:
+        elementlist,classes=conjugacy_classes(generators)
+        return([(elementlist[members[0]],len(members)) for members in classes])
+    n=len(support)
+    result=[]
+    for partition in _partitions(n):
+        cycles=[]
+        first=0
+        for k in partition:
+            if k>1:
+                cycles.append(tuple(support[first:first+k]))
+            first+=k
+        representative=from_cycle(cycles)
+        size=_class_size(n,partition)
+        if kind=='A':
+            if (n-len(partition))%2:
+                continue
+            if all(k%2 for k in partition) and len(set(partition))==len(partition) and n>1:
+                # the class of S_n splits into two classes of A_n
+                t=from_cycle([(support[0],support[1])])
+                result.append((representative,size//2))
+                result.append((compose(compose(t,representative),t),size//2))
+                continue
+        result.append((representative,size))
+    return(result)
@@ -0,0 +1,108 @@
+'''
+coset tables, the assignment of group elements to the cosets of a normal subgroup
+'''
+
+from array import array
+
+from .permutation import TYPECODE, from_image
+from .arithmetic import compose
+from .batch import batch_degree, to_batch, from_batch, batch_compose
+
+class CosetTable:
+    '''
+    assignment of the elements of 'group' to the left cosets g*N of the subgroup 'normalgroup'.
+    'elements': the list of the elements of group, the elements of 'table' if a CayleyTable is given
+    'index': maps each element to its position in elements
+    'coset_id': a typed array, coset_id[k] is the number (1,2,...) of the coset of elements[k]
+    'representatives': representatives[c-1] is the first element of coset c in elements
+    every element is assigned in one pass, each coset costs |N| products.
+    the table can be used like the dictionary homomorphism that maps each element
+    to the number of its coset: homomorphism[perm], homomorphism.get(perm), homomorphism.items()
+    '''
+
+    def __init__(self, group, normalgroup, table=None, vectorized=False):
+        if table is not None:
+            self.elements=table.elements
+            self.index=table.index
+        else:
+            self.elements=list(group)
+            self.index={g:k for k,g in enumerate(self.elements)}
+        self.table=table
+        index=self.index
+        coset_id=array(TYPECODE,[0])*len(self.elements)
+        representatives=[]
+        normal=list(normalgroup)
+        if vectorized:
+            degree=batch_degree(self.elements)
+            normalbatch=to_batch(normal,degree)
+        elif table is not None:
+            normal=[index[n] for n in normal]
+        for k,g in enumerate(self.elements):
+            if coset_id[k]:
+                continue
+            representatives.append(g)
+            c=len(representatives)
+            if vectorized:
+                for x in from_batch(batch_compose(to_batch([g],degree)[0],normalbatch)):
+                    coset_id[index[x]]=c
+            elif table is not None:
+                row=table.row(k)
+                for n in normal:
+                    coset_id[row[n]]=c
+            else:
+                for n in normal:
+                    coset_id[index[compose(g,n)]]=c
+        self.coset_id=coset_id
+        self.representatives=representatives
+
+    def __getitem__(self, perm):
+        return(self.coset_id[self.index[perm]])
+
+    def get(self, perm, default=None):
+        k=self.index.get(perm)
+        if k is None:
+            return(default)
+        return(self.coset_id[k])
+
+    def __contains__(self, perm):
+        return(perm in self.index)
+
+    def __len__(self):
+        return(len(self.elements))
+
+    def __iter__(self):
+        return(iter(self.elements))
+
+    def keys(self):
+        return(iter(self.elements))
+
+    def items(self):
+        return(zip(self.elements,self.coset_id))
+
+    def cosets(self):
+        '''
+        returns the list of cosets, coset c is the set cosets()[c-1]
+        '''
+        result=[set() for _ in self.representatives]
+        for g,c in zip(self.elements,self.coset_id):
+            result[c-1].add(g)
+        return(result)
+
+    def multiplication_table(self):
+        '''
+        returns the multiplication table of the quotient group as a typed array,
+        the number of the coset c1*c2 is at position (c1-1)*k+(c2-1), k the number of cosets
+        '''
+        if self.table is not None:
+            reps=[self.index[a] for a in self.representatives]
+            return(array(TYPECODE,[self.coset_id[self.table.mul(a,b)] for a in reps for b in reps]))
+        return(array(TYPECODE,[self[compose(a,b)] for a in self.representatives for b in self.representatives]))
+
+    def quotient_permutations(self):
+        '''
+        returns the set of the permutations b -> a*b of the cosets, one for each coset a,
+        the quotient group as a permutation group
+        '''
+        k=len(self.representatives)
+        products=self.multiplication_table()
+        return(set(from_image(products[a*k:(a+1)*k]) for a in range(k)))
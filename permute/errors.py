@@ -0,0 +1,31 @@
+'''
+exceptions raised for invalid input
+'''
+
+class Error(Exception):
+    """Base class for exceptions in this module."""
+    pass
+
+# Exception raised van invalid permustion was input
+class InputError(Error):
+    """Exception raised for errors in the input.
+
+    Attributes:
+        expression -- input expression in which the error occurred
+        message -- explanation of the error
+    """
+
+    def __init__(self, expression, message):
+        self.expression = expression
+        self.message = message
+
+class DuplicateElement(InputError):
+    pass
+class MissingElement(InputError):
+    pass
+class NoElementList(InputError):
+    pass
+class InvalidItem(InputError):
+    pass
+class InvalidFile(InputError):
+    pass
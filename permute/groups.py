@@ -0,0 +1,449 @@
+'''
+generated subgroups, normal closures and quotient groups
+'''
+
+from random import shuffle
+from time import perf_counter
+
+from .permutation import to_cycle
+from .arithmetic import identity, compose, invert, commutator
+from .instrument import _record_call
+from .batch import (require_numpy, batch_degree, to_batch, from_batch,
+    batch_compose, batch_conjugate, batch_unique, batch_isin)
+from .schreier import LazyGroup
+from .cosets import CosetTable
+from .parallel import parallel_subgroup
+from .ranking import bitset_subgroup
+
+DEBUGPRINT=False
+
+########################################
+#### Group Operations
+########################################
+
+def subgroup(generators, lazy=False, vectorized=False, workers=None, chunksize=4096, bitset=False):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'lazy':
+            if True the elements are not listed, a LazyGroup is returned
+        'vectorized':
+            if True each fringe is expanded with batched numpy operations
+        'workers':
+            if not None each fringe is expanded by a pool of this many processes,
+            0 means one process per CPU
+        'chunksize':
+            the number of fringe elements a worker process expands in one task
+        'bitset':
+            if True the elements are stored as bitset of their ranks, a BitsetGroup
+            is returned. it needs n!/8 bytes for generators of degree n, n<=12
+    output:
+        return:
+            a set of elements of the group generated by generators
+    '''
+    assert isinstance(generators,(list,set,tuple))
+    if lazy:
+        return(LazyGroup(generators))
+    if vectorized:
+        return(_subgroup_batched(generators))
+    if workers is not None:
+        return(parallel_subgroup(generators,workers or None,chunksize))
+    if bitset:
+        return(bitset_subgroup(generators))
+    start=perf_counter()
+    fringes=[]
+    generated=set([identity()])
+    fringe=set([identity()])
+    while fringe:
+        fringes.append(len(fringe))
+        new_fringe=set()
+        for p1 in generators:
+            for p2 in fringe:
+                element=compose(p1,p2)
+                #print(i,element)
+                if element not in generated:
+                    generated.add(element)
+                    new_fringe.add(element)
+        fringe=new_fringe
+    _record_call('subgroup',start,len(generated),fringes)
+    return(generated)
+
+def iter_subgroup(generators, limit=None, predicate=None):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'limit':
+            stop after this many elements have been yielded
+        'predicate':
+            a function of a permutation, only elements for which it returns True are yielded
+    output:
+        yields:
+            the elements of the group generated by generators, level by level
+            of the breadth-first search, starting with the identity.
+            the search stops as soon as the caller stops iterating
+    '''
+    assert isinstance(generators,(list,set,tuple))
+    if limit is not None and limit<=0:
+        return
+    count=0
+    generated=set([identity()])
+    fringe=[identity()]
+    if predicate is None or predicate(identity()):
+        yield identity()
+        count+=1
+        if count==limit:
+            return
+    while fringe:
+        new_fringe=[]
+        for p1 in generators:
+            for p2 in fringe:
+                element=compose(p1,p2)
+                if element not in generated:
+                    generated.add(element)
+                    new_fringe.append(element)
+                    if predicate is None or predicate(element):
+                        yield element
+                        count+=1
+                        if count==limit:
+                            return
+        fringe=new_fringe
+
+def find_element(generators, predicate):
+    '''
+    returns the first element of the group generated by 'generators'
+    for which predicate returns True, None if there is none, e.g.
+        find_element(generators, lambda g: orderof(g)==4)
+        find_element(generators, lambda g: g(5)!=5)
+    '''
+    for element in iter_subgroup(generators,limit=1,predicate=predicate):
+        return(element)
+    return(None)
+
+def _subgroup_batched(generators):
+    np=require_numpy()
+    start=perf_counter()
+    fringes=[]
+    degree=batch_degree(generators)
+    gens=to_batch(generators,degree)
+    if not len(gens):
+        _record_call('subgroup',start,1,[])
+        return(set([identity()]))
+    generated=to_batch([identity()],degree)
+    fringe=generated
+    while len(fringe):
+        fringes.append(len(fringe))
+        candidates=batch_unique(np.concatenate([batch_compose(g,fringe) for g in gens]))
+        fringe=candidates[~batch_isin(candidates,generated)]
+        generated=np.concatenate([generated,fringe])
+    _record_call('subgroup',start,len(generated),fringes)
+    return(set(from_batch(generated)))
+
+def subgroupX(generators, reduced=None):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'reduced':
+            an variable containuig an empty list
+    output:
+        return:
+            a set of elements of the group generated by generators
+        'reduced':
+            a sublist of generators that still generates the group
+    '''
+    assert isinstance(generators,(list,set,tuple))
+    start=perf_counter()
+    fringes=[]
+    generated=set([identity()])
+    if reduced is  None:
+        reduced=set()
+    else:
+        assert(isinstance(reduced,set))
+        reduced.clear()
+    removed_generators=set()
+    fringe=set([identity()])
+    shuffled_generators=list(generators)
+    shuffle(shuffled_generators)
+    for new_gen in shuffled_generators:
+        if DEBUGPRINT:
+            print("next generator => ",to_cycle(new_gen))
+        if new_gen in removed_generators:
+            if DEBUGPRINT:
+                print("    already removed")
+            continue
+        if new_gen in generated:
+            if DEBUGPRINT:
+                print("    generated by others")
+            removed_generators.add(new_gen)
+            continue
+        new_fringe=set()
+        for p1 in generated.copy():
+            element=compose(p1,new_gen)
+            if DEBUGPRINT:
+                print("compose  => ",to_cycle(element),"=",to_cycle(p1),"*",to_cycle(new_gen))
+            if element not in generated:
+                if DEBUGPRINT:
+                    print("new element to fringe and generated  => ",to_cycle(element))
+                new_fringe.add(element)
+                generated.add(element)
+        for p1 in reduced:
+            for p2 in fringe:
+                element=compose(p1,p2)
+                if element not in generated:
+                    generated.add(element)
+                    new_fringe.add(element)
+        fringe=new_fringe.copy()
+        fringes.append(len(fringe))
+        reduced.add(new_gen)
+        if DEBUGPRINT:
+            print("fringe:",list(map(to_cycle, fringe)))
+            print("reduced:", list(map(to_cycle, reduced))) 
+            print("generated:", list(map(to_cycle, generated))) 
+    if DEBUGPRINT:
+        print("processing remaining fringe")
+    if DEBUGPRINT:
+        print("fringe:",list(map(to_cycle, fringe)))
+        print("reduced:", list(map(to_cycle, reduced))) 
+        print("generated:", list(map(to_cycle, generated))) 
+    while fringe:
+        new_fringe=set()
+        for p1 in reduced:
+            for p2 in fringe:
+                element=compose(p1,p2)
+                if element not in generated:
+                    if DEBUGPRINT:
+                        print("compose  => ",to_cycle(element),"=",to_cycle(p1),"*",to_cycle(new_gen))
+                        print("new element to fringe and generated  => ",to_cycle(element))
+                    generated.add(element)
+                    new_fringe.add(element)
+        fringe=new_fringe.copy()
+        fringes.append(len(fringe))
+        if DEBUGPRINT:
+            print("fringe:",list(map(to_cycle, fringe)))
+            print("reduced:", list(map(to_cycle, reduced))) 
+            print("generated:", list(map(to_cycle, generated))) 
+
+    _record_call('subgroupX',start,len(generated),fringes)
+    return(generated)
+
+
+
+def extend_subgroup(generated, generators, new_generator):
+    '''
+    input:
+        'generated':
+            the set of elements of the group generated by 'generators'
+        'generators':
+            a list of permutations
+        'new_generator':
+            a permutation
+    output:
+        return:
+            the list of elements that were added to 'generated'
+        'generated':
+            is extended in place to the group generated by generators and new_generator
+        'generators':
+            new_generator is appended
+    '''
+    generators.append(new_generator)
+    fringe=[]
+    for p2 in list(generated):
+        element=compose(new_generator,p2)
+        if element not in generated:
+            generated.add(element)
+            fringe.append(element)
+    new_elements=list(fringe)
+    while fringe:
+        new_fringe=[]
+        for p1 in generators:
+            for p2 in fringe:
+                element=compose(p1,p2)
+                if element not in generated:
+                    generated.add(element)
+                    new_fringe.append(element)
+        new_elements.extend(new_fringe)
+        fringe=new_fringe
+    return(new_elements)
+
+def normal_closure(generators, ambient, reduced=None, vectorized=False):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'ambient':
+            a list of generators of a group that contains generators
+        'reduced':
+            an variable containing an empty set
+        'vectorized':
+            if True the conjugates of each new generator are calculated with batched numpy operations
+    output:
+        return:
+            the set of elements of the smallest normal subgroup of the ambient group
+            that contains generators
+        'reduced':
+            the generators of the normal closure that were used
+    the closure is extended in place by each new generator, only the new generators
+    are conjugated and only by the generators of the ambient group
+    '''
+    start=perf_counter()
+    closure,fringes=_normal_closure(generators,ambient,reduced,vectorized)
+    _record_call('normal_closure',start,len(closure),fringes)
+    return(closure)
+
+def _normal_closure(generators, ambient, reduced, vectorized):
+    # returns the closure and the number of elements added by each new generator
+    assert isinstance(generators,(list,set,tuple))
+    assert isinstance(ambient,(list,set,tuple))
+    if reduced is not None:
+        assert(isinstance(reduced,set))
+        reduced.clear()
+    fringes=[]
+    if vectorized:
+        np=require_numpy()
+        degree=batch_degree(generators,ambient)
+        ambientbatch=to_batch(ambient,degree)
+    else:
+        conjugators=[(g,invert(g)) for g in ambient]
+    closure=set([identity()])
+    closure_generators=[]
+    queue=list(generators)
+    while queue:
+        x=queue.pop()
+        if x in closure:
+            continue
+        fringes.append(len(extend_subgroup(closure,closure_generators,x)))
+        if vectorized:
+            rows=np.repeat(to_batch([x],degree),len(ambientbatch),axis=0)
+            conjugates=from_batch(batch_unique(batch_conjugate(rows,ambientbatch)))
+            queue.extend(y for y in conjugates if y not in closure)
+        else:
+            for g,invg in conjugators:
+                queue.append(compose(compose(g,x),invg))
+    if reduced is not None:
+        reduced.update(closure_generators)
+    return((closure,fringes))
+
+def commutator_subgroup(generators, reduced=None):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'reduced':
+            an variable containing an empty set
+    output:
+        return:
+            the set of elements of the commutator subgroup G' of the group G
+            generated by generators, the normal closure in G of the commutators
+            of the generators
+        'reduced':
+            a set of generators of G'
+    '''
+    generators=list(generators)
+    commutators=[commutator(a,b) for k,a in enumerate(generators) for b in generators[k+1:]]
+    return(normal_closure(commutators,generators,reduced))
+
+def derived_series(generators):
+    '''
+    returns the derived series G=G0, G1=G0', G2=G1', ... of the group G
+    generated by 'generators' as a list of sets, it ends with the first
+    group that is equal to its commutator subgroup
+    '''
+    series=[subgroup(generators)]
+    while True:
+        reduced=set()
+        derived=commutator_subgroup(generators,reduced)
+        if len(derived)==len(series[-1]):
+            return(series)
+        series.append(derived)
+        generators=list(reduced)
+
+def lower_central_series(generators):
+    '''
+    returns the lower central series G=L1, L2=[L1,G], L3=[L2,G], ... of the group G
+    generated by 'generators' as a list of sets, it ends with the first
+    group L with [L,G]=L
+    '''
+    generators=list(generators)
+    series=[subgroup(generators)]
+    current=generators
+    while True:
+        reduced=set()
+        commutators=[commutator(a,b) for a in current for b in generators]
+        lower=normal_closure(commutators,generators,reduced)
+        if len(lower)==len(series[-1]):
+            return(series)
+        series.append(lower)
+        current=list(reduced)
+
+def is_solvable(generators):
+    '''
+    returns True if the group generated by 'generators' is solvable
+    '''
+    return(len(derived_series(generators)[-1])==1)
+
+def is_nilpotent(generators):
+    '''
+    returns True if the group generated by 'generators' is nilpotent
+    '''
+    return(len(lower_central_series(generators)[-1])==1)
+
+def normalizer(generators, group, vectorized=False):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'group':
+            a set of permutations that form a group and contains generators
+        'vectorized':
+            if True the conjugates are calculated with batched numpy operations
+    output:
+        return:
+            the set of elements of the normal closure of generators in group,
+            the elements of group are used as generators in normal_closure
+    '''
+    assert generators, (list,set,tuple)
+    assert group, (list,set,tuple)
+    start=perf_counter()
+    normalgroup,fringes=_normal_closure(list(generators),list(group),None,vectorized)
+    _record_call('normalizer',start,len(normalgroup),fringes)
+    return(normalgroup)
+
+def commutator_set(group):
+    '''
+    returns the set of the commutators [a,b] of all pairs of elements of 'group',
+    commutator_subgroup calculates the group they generate
+    '''
+    groupdict={a:invert(a) for a in group}
+    centralgroup=set() 
+    for (a,inva) in groupdict.items():
+        for (b,invb) in groupdict.items():
+            centralgroup.add(compose(compose(a,b),compose(inva,invb)))
+    return(centralgroup)
+
+def quotientgroup(group, normalgroup, table=None, vectorized=False):
+    '''
+    input:
+        'group':
+            a set of permutations that form a group
+        'normalgroup':
+            a set of permutations that form a normal subgroup of group
+        'table':
+            a CayleyTable of group, the products are looked up there
+        'vectorized':
+            if True the cosets are calculated with batched numpy operations
+    output:
+        return:
+            a 3-tuple:
+                component 1: the quotient group, a set of permutations of the cosets
+                component 2: the list of cosets, sets of permutations
+                component 3: the homomorphism, a CosetTable that maps each element
+                    of group to the number of its coset in component 2, starting with 1
+    '''
+    start=perf_counter()
+    homomorphism=CosetTable(group,normalgroup,table,vectorized)
+    homomorphic_group=homomorphism.quotient_permutations()
+    coset=homomorphism.cosets()
+    _record_call('quotientgroup',start,len(homomorphic_group),[len(c) for c in coset])
+    return(homomorphic_group,coset,homomorphism)
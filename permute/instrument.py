@@ -0,0 +1,104 @@
+'''
+operation counters, timings and call summaries
+'''
+
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+##############################################
+#### Instrumentation #########################
+##############################################
+
+class Metrics:
+    '''
+    operation counters and timings collected while measure() is active.
+    'counts': maps the name of an operation to the number of its calls
+    'times': maps the name of an operation to its cumulative wall time in seconds
+    'calls': a summary for each call of subgroup, subgroupX, normalizer and quotientgroup,
+        a dictionary with the keys 'function', 'elements' (the number of elements generated),
+        'fringes' (the fringe size of each BFS level, the coset sizes for quotientgroup)
+        and 'time' (wall time in seconds)
+    '''
+
+    def __init__(self):
+        self.counts={}
+        self.times={}
+        self.calls=[]
+        self._lock=Lock()
+
+    def add(self, name, elapsed):
+        with self._lock:
+            self.counts[name]=self.counts.get(name,0)+1
+            self.times[name]=self.times.get(name,0.0)+elapsed
+
+    def add_call(self, summary):
+        with self._lock:
+            self.calls.append(summary)
+
+    def report(self):
+        '''
+        returns the counters, timings and call summaries as printable text
+        '''
+        lines=['%-16s %10s %12s'%('operation','calls','seconds')]
+        for name in sorted(self.counts):
+            lines.append('%-16s %10d %12.6f'%(name,self.counts[name],self.times[name]))
+        for summary in self.calls:
+            lines.append('%s: %d elements in %.6f seconds, fringes %s'%(
+                summary['function'],summary['elements'],summary['time'],summary['fringes']))
+        return('\n'.join(lines))
+
+# the Metrics of all active measure() blocks
+_collectors=[]
+_collectors_lock=Lock()
+
+@contextmanager
+def measure():
+    '''
+    context manager, the operations called inside the with block
+    are counted and timed in the Metrics object it returns:
+        with measure() as m:
+            subgroup(generators)
+        print(m.counts['compose'])
+    blocks can be nested and used from several threads,
+    each block sees all operations of all threads while it is active
+    '''
+    metrics=Metrics()
+    with _collectors_lock:
+        _collectors.append(metrics)
+    try:
+        yield metrics
+    finally:
+        with _collectors_lock:
+            _collectors.remove(metrics)
+
+def instrumented(name):
+    '''
+    decorator, calls of the decorated function are counted and timed under 'name'.
+    if no measure() block is active only a check of a list is added to the call
+    '''
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _collectors:
+                return func(*args,**kwargs)
+            start=perf_counter()
+            try:
+                return func(*args,**kwargs)
+            finally:
+                elapsed=perf_counter()-start
+                for metrics in list(_collectors):
+                    metrics.add(name,elapsed)
+        return wrapper
+    return decorator
+
+def _record_call(name, start, elements, fringes):
+    # summary of a call of a closure function that started at perf_counter() 'start'
+    if not _collectors:
+        return
+    elapsed=perf_counter()-start
+    summary={'function':name,'elements':elements,'fringes':fringes,'time':elapsed}
+    for metrics in list(_collectors):
+        metrics.add(name,elapsed)
+        metrics.add_call(summary)
@@ -0,0 +1,306 @@
+'''
+interactive calculator for group elements
+'''
+
+from functools import lru_cache
+
+from .arithmetic import identity, compose, powerof, orderof
+from .table import print_group1
+
+DEBUGPRINT=False
+
+def extract_integer(expr):
+    s=1
+    ls=0
+    for c in expr:
+        if c=='-':
+            s*=-1
+            ls+=1
+        else:
+            break
+    n=0
+    ln=0
+    for c in expr[ls:]:
+        if ord('0')<= ord(c)<=ord('9'):
+            n*=10
+            n+=int(c)
+            ln+=1
+        else:
+            break
+    if ln==0:
+        n=s
+    else:
+        n*=s
+    return((expr[:ls+ln],expr[ls+ln:],n))
+
+def print_error(expr,pos):
+    print("error")
+    print(expr) 
+    print(' '*(pos-1)+'^')
+
+# instructions of a compiled expression, executed on a stack:
+#   ('load',symbol,pos)  push the element of symbol, pos is its position in the expression
+#   ('id',)              push the identity
+#   ('pow',n)            replace the top element by its n-th power
+#   ('mul',)             replace the two top elements a,b by a*b
+#   ('error',pos,msg)    stop, the expression is invalid at position pos
+
+@lru_cache(maxsize=1024)
+def compile_expression(expr):
+    '''
+    compiles an expression of the interpreter to a tuple of instructions.
+    the expression is scanned once from left to right without recursion,
+    compiled expressions are cached by their text
+    '''
+    code=[]
+    # one frame per open parenthesis: [number of factors, position of '(', length of code at '(']
+    frames=[[0,0,0]]
+    i=0
+    n=len(expr)
+    while i<n:
+        c=expr[i]
+        if c=='(':
+            frames.append([0,i+1,len(code)])
+            i+=1
+            continue
+        if c==')':
+            if len(frames)==1:
+                code.append(('error',i+1,'no opening ('))
+                return(tuple(code))
+            if frames.pop()[0]==0:
+                code.append(('id',))
+        else:
+            code.append(('load',c,i+1))
+        i+=1
+        # exponent: a sequence of '-' signs and optional digits, as in extract_integer
+        sign=1
+        while i<n and expr[i]=='-':
+            sign=-sign
+            i+=1
+        start=i
+        while i<n and '0'<=expr[i]<='9':
+            i+=1
+        exponent=sign*int(expr[start:i]) if i>start else sign
+        if exponent!=1:
+            code.append(('pow',exponent))
+        frame=frames[-1]
+        frame[0]+=1
+        if frame[0]>1:
+            code.append(('mul',))
+    if len(frames)>1:
+        # nothing inside the outermost open parenthesis is evaluated before the error
+        del code[frames[1][2]:]
+        code.append(('error',frames[-1][1],'missing closing )'))
+    elif frames[0][0]==0:
+        code.append(('id',))
+    return(tuple(code))
+
+def evaluate(code,val,table=None):
+    '''
+    executes the instructions of compile_expression.
+    'val' maps symbols to permutations, if a CayleyTable 'table' is given
+    the calculation is done with the indices of the table.
+    returns the same 4-tuple as calc_expression
+    '''
+    stack=[]
+    for instruction in code:
+        op=instruction[0]
+        if op=='load':
+            perm=val.get(instruction[1],None)
+            if perm is None:
+                return((False,None,instruction[2],'invalid element'))
+            stack.append(perm if table is None else table.index[perm])
+        elif op=='mul':
+            b=stack.pop()
+            a=stack.pop()
+            stack.append(compose(a,b) if table is None else table.mul(a,b))
+        elif op=='pow':
+            x=stack.pop()
+            if table is None:
+                stack.append(powerof(x,instruction[1]%orderof(x)))
+            else:
+                stack.append(table.pow(x,instruction[1]%orderof(table.elements[x])))
+        elif op=='id':
+            stack.append(identity() if table is None else table.index[identity()])
+        else:
+            return((False,None,instruction[1],instruction[2]))
+    result=stack.pop()
+    return((True,result if table is None else table.elements[result],0,''))
+
+def calc_expression(expr,val,table=None):
+    '''
+    input:
+        'expr':
+            an expression like "(ab)2c-1", a product of symbols and parenthesized
+            expressions, each can be followed by an integer exponent
+        'val':
+            a dictionary that maps symbols to permutations
+        'table':
+            a CayleyTable of the elements, the products are looked up there
+    output:
+        return:
+            a 4-tuple:
+                component 1: True if the expression is valid
+                component 2: the value of the expression
+                component 3: the position of the error, 0 if there is none
+                component 4: the error message, '' if there is none
+    '''
+    code=compile_expression(expr)
+    if DEBUGPRINT:
+        print("calc_expression ==> '"+expr+"'",code)
+    return(evaluate(code,val,table))
+
+def set_product(line,symbol,val,table=None):
+    '''
+    calculates the product of two complexes, 'line' is like "a b * c d".
+    returns None if line is not a set operation, (True, sorted list of the symbols
+    of the product, the identity first) or (False, error message) otherwise
+    '''
+    complexes=line.split('*')
+    if len(complexes)==1:
+        return(None)
+    if len(complexes)!=2:
+        return((False,"invalid set operation: more than one '*' operator"))
+    left=complexes[0].split()
+    right=complexes[1].split()
+    if len(left)==0:
+        return((False,"invalid set operation: no left complex"))
+    if len(right)==0:
+        return((False,"invalid set operation: no right complex"))
+    product=[]
+    for c1 in left:
+        perm1=val.get(c1,None)
+        if perm1 is None:
+            return((False,"invalid set operation: symbol '"+c1+"' is invalid'"))
+        for c2 in right:
+            perm2=val.get(c2,None)
+            if perm2 is None:
+                return((False,"invalid set operation: symbol '"+c2+"' is invalid'"))
+            if table is None:
+                perm=compose(perm1,perm2)
+            else:
+                perm=table.product(perm1,perm2)
+            product.append(symbol[perm])
+    e=symbol[identity()]
+    product=list(set(product))
+    if e in product:
+        product.remove(e)  
+        product.sort()  
+        product.insert(0,e)
+    else:
+        product.sort()  
+    return((True,product))
+
+def calc_sets(line,symbol,val,table=None):
+    result=set_product(line,symbol,val,table)
+    if result is None:
+        return(False)
+    if result[0]:
+        print(' '.join(result[1]))
+    else:
+        print(result[1])
+    return(True)
+
+def swap_symbols(parts,elementlist,symbol,val,rename):
+    '''
+    executes the commands ':r a b' (rename=True) and ':s a b' (rename=False),
+    'parts' is the command split into words.
+    ':s' swaps the positions of the elements of the symbols a and b in elementlist,
+    ':r' swaps their symbols too.
+    returns an error message or None
+    '''
+    if len(parts)<3:
+        return("'"+parts[0]+"' needs two symbols")
+    symb1=parts[1]
+    symb2=parts[2]
+    perm1=val.get(symb1,None)  
+    perm2=val.get(symb2,None)  
+    if perm1 is None:
+        return("'"+symb1+"' is not a valid symbol'")
+    if perm2 is None:
+        return("'"+symb2+"' is not a valid symbol'")
+    ind1=elementlist.index(perm1)
+    ind2=elementlist.index(perm2)
+    if rename:
+        symbol[perm1]=symb2
+        symbol[perm2]=symb1
+        val[symb1]=perm2
+        val[symb2]=perm1
+    elementlist[ind1]=perm2
+    elementlist[ind2]=perm1
+    return(None)
+
+def execute_command(inp,elementlist,symbol,val,table=None):
+    '''
+    executes one command of the interpreter without printing.
+    returns None for an empty line, ':q' for the quit command and a dictionary otherwise:
+        {'table': rows}          for ':p', the rows of the Cayley table as lists of symbols,
+                                 the first row is the list of the symbols of elementlist
+        {'ok': True}             for ':r' and ':s'
+        {'set': symbols}         for a set product
+        {'value': symbol}        for an expression
+        {'error': message}       if the command is invalid, with 'position' for expressions
+    '''
+    parts=inp.split()
+    if not parts:
+        return(None)
+    if inp==':q':
+        return(':q')
+    if inp==':p':
+        rows=[[symbol[b] for b in elementlist]]
+        for a in elementlist:
+            if table is None:
+                rows.append([symbol[compose(a,b)] for b in elementlist])
+            else:
+                row=table.row(table.index[a])
+                rows.append([symbol[table.elements[row[table.index[b]]]] for b in elementlist])
+        return({'table':rows})
+    if parts[0] in (':r',':s'):
+        error=swap_symbols(parts,elementlist,symbol,val,parts[0]==':r')
+        if error is not None:
+            return({'error':error})
+        return({'ok':True})
+    result=set_product(inp,symbol,val,table)
+    if result is not None:
+        if result[0]:
+            return({'set':result[1]})
+        return({'error':result[1]})
+    result=calc_expression(inp,val,table)
+    if not result[0]:
+        return({'error':result[3],'position':result[2]})
+    return({'value':symbol[result[1]]})
+
+
+def interpreter(elementlist,symbol,val,table=None):
+    # read loop:
+    print("starting interpreter ....")
+    while True:
+        inp=input('$ ')
+        parts=inp.split()
+        if not parts:
+            continue
+        if inp==':q':
+            break
+        if inp==':p':
+            #print table
+            print_group1(elementlist,symbol,table)
+            continue
+        if parts[0]==':r' or parts[0]==':s':
+            # ':r' renames elements, ':s' swaps elements positions
+            error=swap_symbols(parts,elementlist,symbol,val,parts[0]==':r')
+            if error is not None:
+                print(error)
+            continue
+        is_set_calculation=calc_sets(inp,symbol,val,table)
+        if is_set_calculation:
+            continue
+        result=calc_expression(inp,val,table)
+        if not result[0]:
+            print("ERROR")
+            print(inp)
+            print(' '*(result[2]-1)+'^')
+            print(result[3])
+            continue
+        print(inp+" = "+symbol[result[1]])
+
+# interpreter(idesc[0],idesc[1],idesc[2],idesc[3])
@@ -0,0 +1,48 @@
+'''
+histograms of element invariants over groups
+'''
+
+def order_histogram(elements):
+    '''
+    input:
+        'elements':
+            an iterable of permutations, e.g. the result of subgroup
+    output:
+        return:
+            a dictionary that maps each element order to the number of elements
+            of this order, ordered by the order
+    '''
+    counts={}
+    for g in elements:
+        counts[g.order]=counts.get(g.order,0)+1
+    return(dict(sorted(counts.items())))
+
+def cycle_type_histogram(elements):
+    '''
+    input:
+        'elements':
+            an iterable of permutations
+    output:
+        return:
+            a dictionary that maps each cycle type (a tuple of the cycle lengths greater
+            than 1, the identity has the cycle type ()) to the number of elements
+            of this cycle type, ordered by the cycle type
+    '''
+    counts={}
+    for g in elements:
+        counts[g.cycle_type]=counts.get(g.cycle_type,0)+1
+    return(dict(sorted(counts.items())))
+
+def elements_of_order(elements, order):
+    '''
+    returns the list of the elements of the given order
+    '''
+    return([g for g in elements if g.order==order])
+
+def elements_of_cycle_type(elements, cycle_type):
+    '''
+    returns the list of the elements of the given cycle type,
+    the cycle lengths can be given in any order, cycles of length 1 are ignored
+    '''
+    cycle_type=tuple(sorted((k for k in cycle_type if k>1),reverse=True))
+    return([g for g in elements if g.cycle_type==cycle_type])
@@ -0,0 +1,143 @@
+'''
+orbits, Schreier vectors and stabilizers of points, tuples and sets
+'''
+
+from array import array
+
+from .arithmetic import identity, compose, invert
+from .schreier import StabilizerChain
+
+def _degree(generators):
+    return(max((g.degree for g in generators),default=0))
+
+def _act(obj, g):
+    # the image of a point, a tuple of points or a set of points under g
+    if isinstance(obj,int):
+        return(g(obj))
+    if isinstance(obj,tuple):
+        return(tuple(g(q) for q in obj))
+    return(frozenset(g(q) for q in obj))
+
+def schreier_vector(point, generators):
+    '''
+    input:
+        'point':
+            a positive integer
+        'generators':
+            a list of permutations
+    output:
+        return:
+            a 2-tuple:
+                component 1: the orbit of point as list, in the order the points are found
+                component 2: the Schreier vector, an array v with v[q]=0 if q is not in the orbit,
+                    v[point]=-1 and v[q]=k+1 if q was reached by generators[k]
+    '''
+    degree=max(_degree(generators),point)
+    vector=array('i',[0])*(degree+1)
+    vector[point]=-1
+    orbit=[point]
+    for q in orbit:
+        for k,g in enumerate(generators):
+            r=g(q)
+            if not vector[r]:
+                vector[r]=k+1
+                orbit.append(r)
+    return((orbit,vector))
+
+def trace(q, vector, generators):
+    '''
+    returns a permutation u with u(point)==q, built from the word of generators
+    that the Schreier vector 'vector' of point stores for q
+    '''
+    u=identity()
+    inverses={}
+    while vector[q]!=-1:
+        k=vector[q]-1
+        u=compose(u,generators[k])
+        if k not in inverses:
+            inverses[k]=invert(generators[k])
+        q=inverses[k](q)
+    return(u)
+
+def orbit(obj, generators):
+    '''
+    returns the orbit of 'obj' under the group generated by 'generators' as a list.
+    obj is a point, a tuple of points (ordered) or a set of points (unordered)
+    '''
+    if isinstance(obj,int):
+        return(schreier_vector(obj,generators)[0])
+    if not isinstance(obj,tuple):
+        obj=frozenset(obj)
+    seen=set([obj])
+    result=[obj]
+    for x in result:
+        for g in generators:
+            y=_act(x,g)
+            if y not in seen:
+                seen.add(y)
+                result.append(y)
+    return(result)
+
+def orbit_transversal(obj, generators):
+    '''
+    returns a dictionary that maps each element x of the orbit of 'obj'
+    to a permutation u with u(obj)==x
+    '''
+    if not isinstance(obj,(int,tuple)):
+        obj=frozenset(obj)
+    transversal={obj:identity()}
+    stack=[obj]
+    while stack:
+        x=stack.pop()
+        u=transversal[x]
+        for g in generators:
+            y=_act(x,g)
+            if y not in transversal:
+                transversal[y]=compose(g,u)
+                stack.append(y)
+    return(transversal)
+
+def stabilizer(obj, generators):
+    '''
+    returns a list of generators of the stabilizer of 'obj' in the group generated by 'generators'.
+    obj is a point, a tuple of points (ordered) or a set of points (unordered).
+    the Schreier generators u(g(x))^-1*g*u(x) are sifted through a stabilizer chain,
+    the redundant ones are dropped
+    '''
+    transversal=orbit_transversal(obj,generators)
+    inverses={}
+    chain=StabilizerChain([])
+    result=[]
+    for x,u in transversal.items():
+        for g in generators:
+            y=_act(x,g)
+            if y not in inverses:
+                inverses[y]=invert(transversal[y])
+            h=compose(inverses[y],compose(g,u))
+            if chain.extend(h):
+                result.append(h)
+    return(result)
+
+def orbit_partition(generators, degree=None):
+    '''
+    returns the orbits of the group generated by 'generators' on the points 1,...,degree
+    as a list of lists, each point is visited once.
+    degree is the largest point moved by a generator if None
+    '''
+    if degree is None:
+        degree=_degree(generators)
+    seen=bytearray(degree+1)
+    orbits=[]
+    for point in range(1,degree+1):
+        if seen[point]:
+            continue
+        seen[point]=1
+        current=[point]
+        for q in current:
+            for g in generators:
+                r=g(q)
+                if not seen[r]:
+                    seen[r]=1
+                    current.append(r)
+        orbits.append(current)
+    return(orbits)
@@ -0,0 +1,88 @@
+'''
+subgroup closure with the fringe of each BFS level shared out to a process pool
+'''
+
+from array import array
+from time import perf_counter
+
+from .permutation import TYPECODE, Permutation
+from .instrument import _record_call
+
+# permutations are sent to and from the workers as rows of fixed width:
+# the bytes of an array of the 0-based images of 0,...,degree-1.
+# a chunk is the concatenation of such rows
+
+# the generators of a worker process, set by _init_worker
+_generators=None
+
+def _row(perm, degree):
+    images=array(TYPECODE,perm._images)
+    images.extend(range(len(images),degree))
+    return(images.tobytes())
+
+def _perm(row):
+    images=array(TYPECODE)
+    images.frombytes(row)
+    return(Permutation(images))
+
+def _init_worker(generator_rows):
+    global _generators
+    _generators=[]
+    for row in generator_rows:
+        images=array(TYPECODE)
+        images.frombytes(row)
+        _generators.append(images)
+
+def _expand(chunk):
+    # the products g*f for all generators g and all rows f of chunk,
+    # duplicates are removed before they are sent back
+    rows=array(TYPECODE)
+    rows.frombytes(chunk)
+    degree=len(_generators[0])
+    products=set()
+    for k in range(0,len(rows),degree):
+        f=rows[k:k+degree]
+        for g in _generators:
+            products.add(array(TYPECODE,[g[x] for x in f]).tobytes())
+    return(b''.join(products))
+
+def parallel_subgroup(generators, workers=None, chunksize=4096):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'workers':
+            the number of worker processes, the number of CPUs if None
+        'chunksize':
+            the number of fringe elements a worker expands in one task
+    output:
+        return:
+            a set of elements of the group generated by generators,
+            the same set that subgroup(generators) returns
+    '''
+    from concurrent.futures import ProcessPoolExecutor
+    start=perf_counter()
+    fringes=[]
+    degree=max((g.degree for g in generators),default=0)
+    if degree==0:
+        _record_call('subgroup',start,1,[1])
+        return(set([Permutation()]))
+    rowsize=degree*array(TYPECODE).itemsize
+    identity_row=_row(Permutation(),degree)
+    generated=set([identity_row])
+    fringe=[identity_row]
+    generator_rows=[_row(g,degree) for g in generators]
+    with ProcessPoolExecutor(workers,initializer=_init_worker,initargs=(generator_rows,)) as pool:
+        while fringe:
+            fringes.append(len(fringe))
+            chunks=[b''.join(fringe[k:k+chunksize]) for k in range(0,len(fringe),chunksize)]
+            new_fringe=[]
+            for products in pool.map(_expand,chunks):
+                for k in range(0,len(products),rowsize):
+                    row=products[k:k+rowsize]
+                    if row not in generated:
+                        generated.add(row)
+                        new_fringe.append(row)
+            fringe=new_fringe
+    _record_call('subgroup',start,len(generated),fringes)
+    return(set(_perm(row) for row in generated))
@@ -0,0 +1,246 @@
+'''
+internal representation of permutations and conversion to and from image and cycle lists
+'''
+
+from array import array
+from itertools import count
+from math import gcd
+from threading import Lock
+from weakref import WeakValueDictionary
+
+##############################################
+#### Internal representation ################
+##############################################
+
+# typecode of the arrays that hold the images of a permutation
+TYPECODE='I'
+
+# the interning pool: maps the bytes of the images to the only permutation with these images,
+# a permutation is removed when it is no longer used
+_pool=WeakValueDictionary()
+_ids=count()
+# a new permutation is looked up again and inserted under the lock, so that two threads
+# never create two objects for the same images
+_pool_lock=Lock()
+
+class Permutation:
+    '''
+    internal representation of a permutation.
+    the images of 1,...,n are stored 0-based in a typed array,
+    trailing fixed points are stripped, so two equal permutations
+    always have equal arrays, whatever n was used to input them.
+    'p*q' is the composition p(q(x)), '~p' the inverse and 'p**n' the n-th power.
+    permutations are interned: there is only one object for each permutation,
+    so equality is identity and the hash is a small integer id.
+    the cycle decomposition and the invariants derived from it (cycle type, order,
+    sign, support, fixed points) are calculated on first use and kept.
+    '''
+    __slots__=('_images','_id','_cycles','_invariants','__weakref__')
+
+    def __new__(cls, images=()):
+        '''
+        'images': the 0-based images of 0,...,n-1, no validation is done.
+        returns the existing permutation with these images if there is one
+        '''
+        images=array(TYPECODE,images)
+        n=len(images)
+        while n and images[n-1]==n-1:
+            n-=1
+        del images[n:]
+        key=images.tobytes()
+        self=_pool.get(key)
+        if self is None:
+            with _pool_lock:
+                self=_pool.get(key)
+                if self is None:
+                    self=object.__new__(cls)
+                    self._images=images
+                    self._id=next(_ids)
+                    self._cycles=None
+                    self._invariants=None
+                    _pool[key]=self
+        return self
+
+    @property
+    def id(self):
+        '''
+        the integer id of the permutation, ids are not reused within a process
+        '''
+        return self._id
+
+    @property
+    def degree(self):
+        '''
+        the largest point moved by the permutation, 0 for the identity
+        '''
+        return len(self._images)
+
+    def __call__(self, k):
+        '''
+        the image of the point k
+        '''
+        if 0<k<=len(self._images):
+            return self._images[k-1]+1
+        return k
+
+    def cycles(self):
+        '''
+        the cycles of length greater than 1 as tuples of 0-based points,
+        each cycle starts with its smallest point, the cycles are ordered by it
+        '''
+        if self._cycles is None:
+            cycles=[]
+            images=self._images
+            seen=bytearray(len(images))
+            for k in range(len(images)):
+                if seen[k] or images[k]==k:
+                    continue
+                cycle=[]
+                nextelement=k
+                while not seen[nextelement]:
+                    seen[nextelement]=1
+                    cycle.append(nextelement)
+                    nextelement=images[nextelement]
+                cycles.append(tuple(cycle))
+            self._cycles=tuple(cycles)
+        return self._cycles
+
+    def _calculate_invariants(self):
+        cycles=self.cycles()
+        order=1
+        moved=0
+        for cycle in cycles:
+            order=order*len(cycle)//gcd(order,len(cycle))
+            moved+=len(cycle)
+        cycle_type=tuple(sorted((len(cycle) for cycle in cycles),reverse=True))
+        sign=-1 if (moved-len(cycles))%2 else 1
+        self._invariants=(cycle_type,order,sign,moved)
+        return self._invariants
+
+    @property
+    def cycle_type(self):
+        '''
+        the lengths of the cycles of length greater than 1 in descending order
+        '''
+        return (self._invariants or self._calculate_invariants())[0]
+
+    @property
+    def order(self):
+        '''
+        the order, the least common multiple of the cycle lengths
+        '''
+        return (self._invariants or self._calculate_invariants())[1]
+
+    @property
+    def sign(self):
+        '''
+        1 for even and -1 for odd permutations
+        '''
+        return (self._invariants or self._calculate_invariants())[2]
+
+    @property
+    def support(self):
+        '''
+        the set of the points moved by the permutation
+        '''
+        return frozenset(k+1 for cycle in self.cycles() for k in cycle)
+
+    @property
+    def fixed_points(self):
+        '''
+        the number of points of 1,...,degree that are not moved,
+        add n-degree for the fixed points of 1,...,n
+        '''
+        return len(self._images)-(self._invariants or self._calculate_invariants())[3]
+
+    def __mul__(self, other):
+        a=self._images
+        b=other._images
+        la=len(a)
+        if la>=len(b):
+            images=array(TYPECODE,[a[x] for x in b])
+            images.extend(a[len(b):])
+        else:
+            images=array(TYPECODE,[a[x] if x<la else x for x in b])
+        return Permutation(images)
+
+    def __invert__(self):
+        a=self._images
+        images=array(TYPECODE,a)
+        for k,v in enumerate(a):
+            images[v]=k
+        return Permutation(images)
+
+    def __pow__(self, n):
+        # every cycle is rotated by n modulo its length
+        images=array(TYPECODE,range(len(self._images)))
+        for cycle in self.cycles():
+            k=n%len(cycle)
+            if k:
+                for a,b in zip(cycle,cycle[k:]+cycle[:k]):
+                    images[a]=b
+        return Permutation(images)
+
+    def powers(self):
+        '''
+        the list of all powers p**0,...,p**(m-1), m the order of p
+        '''
+        cycles=self.cycles()
+        m=self.order
+        identity=array(TYPECODE,range(len(self._images)))
+        result=[]
+        for k in range(m):
+            images=array(TYPECODE,identity)
+            for cycle in cycles:
+                j=k%len(cycle)
+                if j:
+                    for a,b in zip(cycle,cycle[j:]+cycle[:j]):
+                        images[a]=b
+            result.append(Permutation(images))
+        return result
+
+    # equality is identity, as for object
+    def __hash__(self):
+        return self._id
+
+    def __reduce__(self):
+        # the id depends on the process, the copy is interned when it is loaded
+        return (Permutation,(self._images,))
+
+    def __repr__(self):
+        return 'to_permutation(%s)'%', '.join(str(c) for c in to_cycle(self))
+
+##############################################
+#### Conversion ##############################
+##############################################
+
+def from_image(imagelist):
+    '''
+    convert a permutation represented as imagelist to the internal representation
+    '''
+    return(Permutation([v-1 for v in imagelist]))
+
+def from_cycle(cyclelist):
+    '''
+    convert a permutation represented as cyclelist to the internal representation
+    '''
+    n=max((max(cycle) for cycle in cyclelist if cycle),default=0)
+    images=array(TYPECODE,range(n))
+    for cycle in cyclelist:
+        p=cycle[-1]
+        for e in cycle:
+            images[p-1]=e-1
+            p=e
+    return(Permutation(images))
+
+def to_cycle(perm):
+    '''
+    convert a permutation from its internal representation to a cycle list
+    '''
+    return(tuple(tuple(k+1 for k in cycle) for cycle in perm.cycles()))
+
+def to_image(perm):
+    '''
+    convert a permutation from its internal representation to an image list
+    '''
+    return(tuple(v+1 for v in perm._images))
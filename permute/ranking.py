@@ -0,0 +1,208 @@
+'''
+Lehmer code ranks of permutations and subgroups stored as bitsets of ranks
+'''
+
+from array import array
+from math import factorial
+from time import perf_counter
+
+from .permutation import Permutation
+from .instrument import _record_call
+from .batch import require_numpy
+
+# the largest degree of a BitsetGroup, 12!/8 bytes are about 57 MB
+MAX_BITSET_DEGREE=12
+
+################################################
+#### Rank and unrank ###########################
+################################################
+
+def rank(perm, n=None):
+    '''
+    input:
+        'perm':
+            a permutation
+        'n':
+            the degree of the symmetric group, the degree of perm if None
+    output:
+        return:
+            the position of the imagelist of perm in the lexicographic order of all
+            permutations of 1,...,n, an integer in 0,...,n!-1, calculated from the Lehmer code
+    '''
+    images=perm._images
+    if n is None:
+        n=len(images)
+    if len(images)>n:
+        raise ValueError("%r is not a permutation of 1,...,%d"%(perm,n))
+    return(_rank(images,n))
+
+def _rank(images, n):
+    # unused has bit v set if the value v is not yet used, the Lehmer digit is the
+    # number of unused values smaller than the current one
+    r=0
+    unused=(1<<n)-1
+    d=len(images)
+    for i in range(n):
+        v=images[i] if i<d else i
+        r=r*(n-i)+bin(unused&((1<<v)-1)).count('1')
+        unused^=1<<v
+    return(r)
+
+def _unrank(r, n):
+    code=[0]*n
+    for i in range(n-1,-1,-1):
+        r,code[i]=divmod(r,n-i)
+    available=list(range(n))
+    return([available.pop(c) for c in code])
+
+def unrank(r, n):
+    '''
+    the inverse of rank: returns the permutation of 1,...,n with rank r
+    '''
+    if not 0<=r<factorial(n):
+        raise ValueError("rank %d is not in 0,...,%d!-1"%(r,n))
+    return(Permutation(_unrank(r,n)))
+
+def rank_many(perms, n):
+    '''
+    returns the ranks of the iterable 'perms' of permutations of 1,...,n as list
+    '''
+    return([rank(g,n) for g in perms])
+
+def unrank_many(ranks, n):
+    '''
+    returns the list of the permutations of 1,...,n with the ranks in the iterable 'ranks'
+    '''
+    return([unrank(r,n) for r in ranks])
+
+def batch_rank(batch):
+    '''
+    returns the ranks of the rows of a batch as int64 numpy array, the degree of the batch
+    must be at most 20
+    '''
+    np=require_numpy()
+    batch=np.asarray(batch)
+    n=batch.shape[1]
+    if n>20:
+        raise ValueError("ranks of degree %d do not fit into 64 bits"%n)
+    ranks=np.zeros(len(batch),dtype=np.int64)
+    for i in range(n):
+        smaller=(batch[:,i+1:]<batch[:,i:i+1]).sum(axis=1)
+        ranks=ranks*(n-i)+smaller
+    return(ranks)
+
+def batch_unrank(ranks, n):
+    '''
+    returns the batch of degree n of the permutations with the given ranks
+    '''
+    np=require_numpy()
+    ranks=np.asarray(ranks,dtype=np.int64)
+    code=np.empty((len(ranks),n),dtype=np.int64)
+    for i in range(n-1,-1,-1):
+        ranks,code[:,i]=np.divmod(ranks,n-i)
+    available=np.ones((len(code),n),dtype=bool)
+    batch=np.empty((len(code),n),dtype=np.uint32)
+    for i in range(n):
+        # the position of the (code+1)-th available value
+        position=(np.cumsum(available,axis=1)>code[:,i:i+1]).argmax(axis=1)
+        batch[:,i]=position
+        available[np.arange(len(code)),position]=False
+    return(batch)
+
+################################################
+#### Bitset groups #############################
+################################################
+
+class BitsetGroup:
+    '''
+    a set of permutations of 1,...,n stored as a bitset over their ranks,
+    it needs n!/8 bytes whatever the number of elements, n must not exceed MAX_BITSET_DEGREE.
+    supports 'in', len(), iteration in rank order and add()
+    '''
+
+    def __init__(self, n, elements=()):
+        if n>MAX_BITSET_DEGREE:
+            raise ValueError("a bitset of degree %d needs %d!/8 bytes, the largest degree is %d"%(n,n,MAX_BITSET_DEGREE))
+        self.n=n
+        self._bits=bytearray((factorial(n)+7)//8)
+        self._count=0
+        for g in elements:
+            self.add(g)
+
+    def add_rank(self, r):
+        '''
+        adds the permutation of rank r, returns True if it was not an element before
+        '''
+        byte,bit=r>>3,1<<(r&7)
+        if self._bits[byte]&bit:
+            return(False)
+        self._bits[byte]|=bit
+        self._count+=1
+        return(True)
+
+    def add(self, perm):
+        if perm.degree>self.n:
+            raise ValueError("%r is not a permutation of 1,...,%d"%(perm,self.n))
+        return(self.add_rank(_rank(perm._images,self.n)))
+
+    def contains_rank(self, r):
+        return(bool(self._bits[r>>3]&(1<<(r&7))))
+
+    def __contains__(self, perm):
+        if perm.degree>self.n:
+            return(False)
+        return(self.contains_rank(_rank(perm._images,self.n)))
+
+    def __len__(self):
+        return(self._count)
+
+    def ranks(self):
+        '''
+        yields the ranks of the elements in ascending order
+        '''
+        for byte,value in enumerate(self._bits):
+            if value:
+                for bit in range(8):
+                    if value&(1<<bit):
+                        yield((byte<<3)|bit)
+
+    def __iter__(self):
+        for r in self.ranks():
+            yield(Permutation(_unrank(r,self.n)))
+
+def bitset_subgroup(generators, n=None):
+    '''
+    input:
+        'generators':
+            a list of permutations
+        'n':
+            the degree of the symmetric group that contains the group,
+            the largest degree of the generators if None
+    output:
+        return:
+            a BitsetGroup of the elements of the group generated by generators.
+            the closure works on ranks and image lists, the fringes are lists of ranks
+    '''
+    assert isinstance(generators,(list,set,tuple))
+    if n is None:
+        n=max((g.degree for g in generators),default=0)
+    start=perf_counter()
+    fringes=[]
+    gens=[list(g._images)+list(range(g.degree,n)) for g in generators]
+    generated=BitsetGroup(n)
+    identity_rank=0
+    generated.add_rank(identity_rank)
+    fringe=array('Q',[identity_rank])
+    while fringe:
+        fringes.append(len(fringe))
+        new_fringe=array('Q')
+        for r in fringe:
+            images=_unrank(r,n)
+            for g in gens:
+                # the images of g*x are g[x[k]]
+                r1=_rank([g[v] for v in images],n)
+                if generated.add_rank(r1):
+                    new_fringe.append(r1)
+        fringe=new_fringe
+    _record_call('subgroup',start,len(generated),fringes)
+    return(generated)
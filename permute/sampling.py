@@ -0,0 +1,112 @@
+'''
+random elements by product replacement and statistics estimated from samples
+'''
+
+from random import Random
+
+from .arithmetic import identity, compose, invert
+from .invariants import order_histogram, cycle_type_histogram
+from .orbits import orbit
+from .conjugacy import symmetric_group_kind
+
+class ProductReplacement:
+    '''
+    generates random elements of the group generated by 'generators' without listing it.
+    the state is a list of at least 'slots' group elements, initially the generators repeated,
+    it has at least 2 elements.
+    each step replaces a random state element s_i by s_i*s_j^(+-1) or s_j^(+-1)*s_i and
+    multiplies an accumulator with the new s_i (the "rattle" variant), the accumulator is
+    the next random element. the first 'warmup' steps are discarded.
+    the sequence of elements depends only on the generators and 'seed'
+    '''
+
+    def __init__(self, generators, seed=None, slots=10, warmup=50):
+        assert isinstance(generators,(list,set,tuple))
+        generators=[g for g in generators if g!=identity()] or [identity()]
+        # a step needs two different positions of the state
+        slots=max(slots,2)
+        state=list(generators)
+        while len(state)<slots:
+            state.extend(generators)
+        self._state=state[:max(slots,len(generators))]
+        self._rng=Random(seed)
+        self._accumulator=identity()
+        for _ in range(warmup):
+            self.next()
+
+    def next(self):
+        '''
+        returns the next random element
+        '''
+        state=self._state
+        rng=self._rng
+        i=rng.randrange(len(state))
+        j=rng.randrange(len(state)-1)
+        if j>=i:
+            j+=1
+        x=state[j] if rng.random()<0.5 else invert(state[j])
+        if rng.random()<0.5:
+            state[i]=compose(state[i],x)
+        else:
+            state[i]=compose(x,state[i])
+        self._accumulator=compose(self._accumulator,state[i])
+        return(self._accumulator)
+
+    def __iter__(self):
+        return(self)
+
+    def __next__(self):
+        return(self.next())
+
+def random_elements(generators, count, seed=None):
+    '''
+    returns a list of 'count' random elements of the group generated by 'generators'
+    '''
+    source=ProductReplacement(generators,seed)
+    return([source.next() for _ in range(count)])
+
+def _frequencies(histogram, samples):
+    return({key:count/samples for key,count in histogram.items()})
+
+def estimate_order_distribution(generators, samples=1000, seed=None):
+    '''
+    returns a dictionary that maps element orders to their estimated proportion
+    of the group generated by 'generators', from 'samples' random elements
+    '''
+    return(_frequencies(order_histogram(random_elements(generators,samples,seed)),samples))
+
+def estimate_cycle_types(generators, samples=1000, seed=None):
+    '''
+    returns a dictionary that maps cycle types to their estimated proportion
+    of the group generated by 'generators', from 'samples' random elements
+    '''
+    return(_frequencies(cycle_type_histogram(random_elements(generators,samples,seed)),samples))
+
+def _is_prime(p):
+    return(p>1 and all(p%q for q in range(2,int(p**0.5)+1)))
+
+def probable_symmetric_group_kind(generators, samples=200, seed=None):
+    '''
+    the same as symmetric_group_kind, but the group order is not calculated.
+    returns ('S',support) or ('A',support) if the group generated by 'generators' is
+    the symmetric or alternating group on the points it moves. if it returns (None,support)
+    the group is probably neither: no random element of 'samples' showed that it is.
+    a transitive group that contains a cycle of prime length p, n/2<p<n-2, contains the
+    alternating group (Jordan). such a cycle is a power of every element with a cycle of
+    length p and other cycles of lengths prime to p, about one in log(n) elements of the
+    alternating group has one. groups on less than 8 points are decided exactly
+    '''
+    support=sorted(set(q for g in generators for q in g.support))
+    n=len(support)
+    if n<8:
+        return(symmetric_group_kind(generators))
+    if len(orbit(support[0],generators))!=n:
+        return((None,support))
+    primes=[q for q in range(n//2+1,n-2) if _is_prime(q)]
+    source=ProductReplacement(generators,seed)
+    for _ in range(samples):
+        cycle_type=source.next().cycle_type
+        if any(cycle_type.count(q)==1 and all(k%q for k in cycle_type if k!=q) for q in primes):
+            kind='S' if any(g.sign==-1 for g in generators) else 'A'
+            return((kind,support))
+    return((None,support))
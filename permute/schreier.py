@@ -0,0 +1,149 @@
+'''
+stabilizer chains computed with the Schreier-Sims algorithm
+'''
+
+from random import choice
+from itertools import product
+
+from .arithmetic import identity
+
+########################################
+#### Stabilizer chain
+########################################
+
+class StabilizerChain:
+    '''
+    base and strong generating set of the group generated by 'generators',
+    computed with the Schreier-Sims algorithm (Knuth's variant).
+    level i of the chain holds the base point base[i], the strong generators
+    that fix base[0],...,base[i-1] and a transversal that maps every point
+    of the orbit of base[i] to a permutation u with u(base[i])==point.
+    the group elements are never listed.
+    '''
+
+    def __init__(self, generators):
+        self.base=[]
+        self.strong_generators=[]
+        self.transversals=[]
+        self._inverses=[]
+        for g in generators:
+            self._add(0,g)
+
+    def extend(self, g):
+        '''
+        adds the permutation g to the group, returns False if g already was an element
+        '''
+        if g in self:
+            return(False)
+        self._add(0,g)
+        return(True)
+
+    def _add(self, k, g):
+        # add g to the strong generators of level k, if it is not already in G_k
+        if self.strip(g,k)==identity():
+            return
+        if k==len(self.base):
+            images=g._images
+            point=next(i for i in range(len(images)) if images[i]!=i)+1
+            self.base.append(point)
+            self.strong_generators.append([])
+            self.transversals.append({point:identity()})
+            self._inverses.append({point:identity()})
+        self.strong_generators[k].append(g)
+        self._close(k,[g*u for u in list(self.transversals[k].values())])
+
+    def _close(self, k, stack):
+        # extend the orbit of level k by the elements in stack,
+        # residues of schreier generators are added to level k+1
+        point=self.base[k]
+        transversal=self.transversals[k]
+        generators=self.strong_generators[k]
+        while stack:
+            g=stack.pop()
+            j=g(point)
+            u=transversal.get(j)
+            if u is None:
+                transversal[j]=g
+                self._inverses[k][j]=~g
+                stack.extend(s*g for s in generators)
+            else:
+                h=self._inverses[k][j]*g
+                if self.strip(h,k+1)!=identity():
+                    self._add(k+1,h)
+
+    def strip(self, perm, level=0):
+        '''
+        sift 'perm' through the chain starting at 'level'
+        returns the residue, it is the identity iff perm is in the stabilizer at 'level'
+        '''
+        for k in range(level,len(self.base)):
+            j=perm(self.base[k])
+            u=self._inverses[k].get(j)
+            if u is None:
+                return(perm)
+            perm=u*perm
+        return(perm)
+
+    def order(self):
+        '''
+        returns the order of the group
+        '''
+        result=1
+        for transversal in self.transversals:
+            result*=len(transversal)
+        return(result)
+
+    def __contains__(self, perm):
+        return(self.strip(perm)==identity())
+
+    def random_element(self, rng=None):
+        '''
+        returns an uniformly distributed random element of the group
+        'rng': an instance of random.Random, the module functions are used if None
+        '''
+        pick=choice if rng is None else rng.choice
+        result=identity()
+        for transversal in self.transversals:
+            result=result*pick(list(transversal.values()))
+        return(result)
+
+    def elements(self):
+        '''
+        iterates over all elements of the group, each exactly once
+        '''
+        for reps in product(*[list(t.values()) for t in self.transversals]):
+            result=identity()
+            for u in reps:
+                result=result*u
+            yield result
+
+
+class LazyGroup:
+    '''
+    the group generated by 'generators'.
+    the elements are not listed, order(), len() and 'in' are answered by a StabilizerChain.
+    len() raises OverflowError for groups of order 2**63 and more (S_21 and larger),
+    order() works for every group
+    '''
+
+    def __init__(self, generators):
+        self.generators=list(generators)
+        self.chain=StabilizerChain(self.generators)
+
+    def order(self):
+        '''
+        returns the order of the group
+        '''
+        return(self.chain.order())
+
+    def __len__(self):
+        return(self.chain.order())
+
+    def __contains__(self, perm):
+        return(perm in self.chain)
+
+    def __iter__(self):
+        return(self.chain.elements())
+
+    def random_element(self, rng=None):
+        return(self.chain.random_element(rng))
@@ -0,0 +1,87 @@
+'''
+non-interactive batch mode of the interpreter, results are written as JSON lines
+
+    python -m permute EXAMPLE [INPUT] [--output FILE]
+        reads interpreter commands from INPUT (standard input if missing or '-')
+        for the group examples[EXAMPLE] and writes one JSON object per command
+'''
+
+import argparse
+import json
+import sys
+
+from .groups import subgroup
+from .table import gen_itemnames1
+from .cayley import CayleyTable
+from .interpreter import execute_command
+
+def setup(generators):
+    '''
+    lists the group generated by 'generators' once for all commands.
+    returns the 4-tuple (elementlist, symbol, val, table) that run_script needs,
+    the rows of the CayleyTable are calculated on first use
+    '''
+    elementlist,symbol,val=gen_itemnames1(subgroup(generators))
+    return((elementlist,symbol,val,CayleyTable(elementlist,lazy=True)))
+
+def run_script(lines, elementlist, symbol, val, table=None, out=None, chunksize=1000):
+    '''
+    input:
+        'lines':
+            an iterable of commands, e.g. an open file, it is read one line at a time
+        'elementlist', 'symbol', 'val', 'table':
+            the group, as returned by setup or describe_group1
+        'out':
+            a writable text file, standard output if None
+        'chunksize':
+            the number of results that are written at once
+    output:
+        return:
+            the number of commands executed
+        'out':
+            one JSON object per command, the result of execute_command with the keys
+            'line' (the line number) and 'command' added
+    the commands ':p', ':r', ':s', ':q', set products and expressions are supported,
+    ':q' stops the script
+    '''
+    if out is None:
+        out=sys.stdout
+    buffer=[]
+    count=0
+    for number,line in enumerate(lines,1):
+        command=line.rstrip('\r\n')
+        result=execute_command(command,elementlist,symbol,val,table)
+        if result is None:
+            continue
+        if result==':q':
+            break
+        count+=1
+        result['line']=number
+        result['command']=command
+        buffer.append(json.dumps(result,ensure_ascii=False))
+        if len(buffer)>=chunksize:
+            out.write('\n'.join(buffer)+'\n')
+            buffer=[]
+    if buffer:
+        out.write('\n'.join(buffer)+'\n')
+    return(count)
+
+def main(argv=None):
+    from . import examples
+    parser=argparse.ArgumentParser(prog='python -m permute',description="run interpreter commands for a group of the examples catalogue")
+    parser.add_argument('example',choices=sorted(examples),help="the name of the group in examples")
+    parser.add_argument('input',nargs='?',default='-',help="file with one command per line, '-' for standard input")
+    parser.add_argument('--output',default='-',help="file for the JSON lines, '-' for standard output")
+    parser.add_argument('--chunksize',type=int,default=1000,help="number of results written at once")
+    args=parser.parse_args(argv)
+    group=setup(examples[args.example][1])
+    infile=sys.stdin if args.input=='-' else open(args.input)
+    outfile=sys.stdout if args.output=='-' else open(args.output,'w')
+    try:
+        run_script(infile,*group,out=outfile,chunksize=args.chunksize)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    return(0)
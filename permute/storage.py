@@ -0,0 +1,219 @@
+'''
+binary files of permutation groups, loaded by memory mapping
+
+a file consists of
+    a header of HEADER.size bytes: magic, format version, itemsize, degree d,
+        number of elements n and flags
+    n rows of d unsigned integers, the 0-based images of the elements padded
+        to degree d, sorted lexicographically
+    if the flag TABLE is set: the n*n indices of the Cayley table,
+        row a holds the indices of the products of element a with all elements
+all integers are stored in the byte order of the machine that wrote the file,
+the flag BIGENDIAN records it
+'''
+
+import mmap
+import struct
+import sys
+from array import array
+
+from .errors import InvalidFile
+from .permutation import TYPECODE, Permutation
+
+MAGIC=b'PERMGRP\0'
+VERSION=1
+HEADER=struct.Struct('<8sHHIQQ')
+
+# flags
+TABLE=1
+BIGENDIAN=2
+
+def _padded(g, degree):
+    images=g._images.tolist()
+    images.extend(range(len(images),degree))
+    return(images)
+
+def save_group(path, group, table=None, chunksize=4096):
+    '''
+    input:
+        'path':
+            the name of the file
+        'group':
+            an iterable of permutations, e.g. the result of subgroup
+        'table':
+            a CayleyTable of the group or None, if it is given the table is saved too
+        'chunksize':
+            the number of rows that are written at once
+    output:
+        return:
+            the number of elements saved
+        the file 'path'
+    '''
+    elements=list(group) if table is None else list(table.elements)
+    degree=max((g.degree for g in elements),default=0)
+    order=sorted(range(len(elements)),key=lambda k:_padded(elements[k],degree))
+    flags=(TABLE if table is not None else 0)|(BIGENDIAN if sys.byteorder=='big' else 0)
+    itemsize=array(TYPECODE).itemsize
+    with open(path,'wb') as f:
+        f.write(HEADER.pack(MAGIC,VERSION,itemsize,degree,len(elements),flags))
+        for start in range(0,len(order),chunksize):
+            rows=array(TYPECODE)
+            for k in order[start:start+chunksize]:
+                rows.extend(_padded(elements[k],degree))
+            rows.tofile(f)
+        if table is not None:
+            # the table of the sorted elements: position[k] is the new index of old index k
+            position=array(TYPECODE,[0])*len(order)
+            for new,old in enumerate(order):
+                position[old]=new
+            for old in order:
+                row=table.row(old)
+                array(TYPECODE,[position[row[b]] for b in order]).tofile(f)
+    return(len(elements))
+
+class StoredGroup:
+    '''
+    a group saved by save_group, the file is memory mapped and nothing is read
+    before it is used.
+    'group[k]' is the k-th element in sorted order, 'row(k)' its padded
+    0-based images as memoryview into the file, 'index(g)' the position of g
+    found by binary search. if the file holds a Cayley table, 'mul(a,b)'
+    and 'table_row(a)' look up products of indices.
+    use it as context manager or call close() to release the file.
+    the memoryviews returned by row() and table_row() point into the file, they must be
+    released (view.release() or del) before close(), otherwise close() raises BufferError;
+    the file itself is closed in any case
+    '''
+
+    def __init__(self, path):
+        self._file=open(path,'rb')
+        self._rows=self._table=self._view=None
+        try:
+            self._map=mmap.mmap(self._file.fileno(),0,access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file can not be mapped
+            self._file.close()
+            raise InvalidFile(path,"file is empty")
+        try:
+            self._open(path)
+        except InvalidFile:
+            self.close()
+            raise
+
+    def _open(self, path):
+        if len(self._map)<HEADER.size:
+            raise InvalidFile(path,"file is too short")
+        magic,version,itemsize,degree,count,flags=HEADER.unpack_from(self._map,0)
+        if magic!=MAGIC:
+            raise InvalidFile(path,"not a group file")
+        if version!=VERSION:
+            raise InvalidFile(path,"unsupported format version %d"%version)
+        if itemsize!=array(TYPECODE).itemsize:
+            raise InvalidFile(path,"itemsize %d is not supported"%itemsize)
+        if bool(flags&BIGENDIAN)!=(sys.byteorder=='big'):
+            raise InvalidFile(path,"file was written with another byte order")
+        size=HEADER.size+count*degree*itemsize
+        if flags&TABLE:
+            size+=count*count*itemsize
+        if len(self._map)!=size:
+            raise InvalidFile(path,"file size does not match the header")
+        self.degree=degree
+        self._count=count
+        self._view=memoryview(self._map)
+        data=self._view[HEADER.size:].cast(TYPECODE)
+        self._rows=data[:count*degree]
+        self._table=data[count*degree:] if flags&TABLE else None
+        data.release()
+
+    def close(self):
+        try:
+            for view in (self._rows,self._table,self._view):
+                if view is not None:
+                    view.release()
+            self._map.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            self.close()
+        except BufferError:
+            # do not hide the exception that left the with block
+            if exc_type is None:
+                raise
+
+    def __len__(self):
+        return(self._count)
+
+    def row(self, k):
+        '''
+        the 0-based images of the k-th element, padded to the degree of the group
+        '''
+        if not 0<=k<self._count:
+            raise IndexError(k)
+        d=self.degree
+        return(self._rows[k*d:(k+1)*d])
+
+    def __getitem__(self, k):
+        if k<0:
+            k+=self._count
+        return(Permutation(self.row(k)))
+
+    def __iter__(self):
+        for k in range(self._count):
+            yield Permutation(self.row(k))
+
+    def _key(self, k):
+        d=self.degree
+        return(self._rows[k*d:(k+1)*d].tolist())
+
+    def index(self, g):
+        '''
+        returns the position of the permutation g, raises ValueError if g is not an element
+        '''
+        if g.degree>self.degree:
+            raise ValueError("%r is not in the group"%g)
+        key=_padded(g,self.degree)
+        lo,hi=0,self._count
+        while lo<hi:
+            mid=(lo+hi)//2
+            if self._key(mid)<key:
+                lo=mid+1
+            else:
+                hi=mid
+        if lo<self._count and self._key(lo)==key:
+            return(lo)
+        raise ValueError("%r is not in the group"%g)
+
+    def __contains__(self, g):
+        try:
+            self.index(g)
+        except ValueError:
+            return(False)
+        return(True)
+
+    @property
+    def has_table(self):
+        return(self._table is not None)
+
+    def table_row(self, a):
+        '''
+        the indices of the products of the element a with all elements
+        '''
+        n=self._count
+        return(self._table[a*n:(a+1)*n])
+
+    def mul(self, a, b):
+        '''
+        returns the index of the product of the elements with index a and b
+        '''
+        return(self._table[a*self._count+b])
+
+def load_group(path):
+    '''
+    opens a file written by save_group, returns a StoredGroup
+    '''
+    return(StoredGroup(path))
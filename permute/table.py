@@ -0,0 +1,114 @@
+'''
+symbols for group elements and printing of Cayley tables
+'''
+
+from .permutation import to_cycle, to_image
+from .arithmetic import identity, compose
+from .cayley import CayleyTable
+from .groups import subgroup
+
+################################################
+#### Table - Output ############################
+################################################
+
+
+def gen_itemnames1(group):
+    '''
+    input: 
+        'group': a set of permutation that form a group
+    output:
+        return: a 3-tuple
+            c1: (elementlist) list of the elements of the set
+                the first element is the identity
+                if it wasn't already in group it is added
+            c2: (symbol)
+                a dictionary that contains a printable symbol for each permutation of elementlist
+            c3: (val) 
+                the inverse of symbol:
+                val[symbol[perm]])=perm, forall perm in elementlist
+    '''
+    group=group.copy()
+    symbol={}
+    val={}
+    i=ord('a')
+    for g in group:
+        if g!=identity():
+            if chr(i)=='e':
+                i+=1
+            if chr(i)==chr(ord('z')+1):
+                i=ord('A')
+            symbol[g]=chr(i)
+            val[chr(i)]=g
+            i+=1
+        else:
+            symbol[g]='e'
+            val['e']=g
+    symbol[identity()]='e'
+    val['e']=identity()
+    group.discard(identity())
+    elementlist=[identity()]
+    elementlist.extend(list(group))
+    return((elementlist,symbol,val))
+    
+
+def print_group1(elementlist,symbol,table=None):
+    '''
+    'elementlist': 
+        is an iterable of n permutations
+    'symbol': 
+        is a dictionary that mpas each permutation or each product of two permutations of elementlist to a printable symbol
+    'table':
+        a CayleyTable of the elements, the products are looked up there
+    output: None
+    sideeffects:
+        print_group1 prints the n x  n - Caley table of the permutations of element lists
+    '''
+    line='  |'
+    for b in elementlist:
+        line+=' '+symbol[b]
+    print(line)
+    line='--+'
+    for b in elementlist:
+        line+='-'+'-'
+    print(line)
+    for a in elementlist:
+        line=symbol[a]+' |'
+        if table is None:
+            for b in elementlist:
+                line+=' '+symbol[compose(a,b)]
+        else:
+            row=table.row(table.index[a])
+            for b in elementlist:
+                line+=' '+symbol[table.elements[row[table.index[b]]]]
+        print(line)
+
+def describe_group1(generators, description):
+    '''
+    input:
+        'generators': 
+            a list of permutations
+        'descritption': 
+            a title that will be printed out
+    output:
+        return:
+            a 4-tuple:
+                component 1:  the list of elements of the group generated by 'generators', the first element in the list is the identity
+                component 2: a dictionary that contains a printable symbol for each permutation of the list in the 1st components
+                component 3: the inverse of component 2
+                component 4: the CayleyTable of the group
+            the first 3 components are similar to the 3-tuple geneated by gen_itemnames1
+            
+    '''
+
+    assert isinstance(generators,(tuple,list,set))
+    assert isinstance(description,str)
+    sg=subgroup(generators)
+    itemdesc=gen_itemnames1(sg)
+    table=CayleyTable(itemdesc[0])
+    print(description)
+    print("Erzeugende:")
+    for perm in generators:
+        print(itemdesc[1][perm],to_image(perm),to_cycle(perm))
+    #print_group1(sg,itemdesc[0],itemdesc[1])
+    print_group1(itemdesc[0],itemdesc[1],table)
+    return(itemdesc+(table,))
@@ -0,0 +1,230 @@
+'''
+validation of image lists and cycle lists, parsing of permutations from text
+'''
+
+from array import array
+
+from .errors import DuplicateElement, MissingElement, NoElementList, InvalidItem
+from .instrument import instrumented
+from .permutation import TYPECODE, Permutation, from_image
+
+# the largest point, its 0-based value must fit into an item of TYPECODE
+MAXPOINT=2**(8*array(TYPECODE).itemsize)
+
+##############################################
+#### Input - Ouput (slow) ####################
+##############################################
+
+@instrumented('check_imagelist')
+def check_imagelist(imagelist):
+    ''' 
+    checks if input is a valid imagelist.
+    an list or tuple is a valid imagelist if it is the 
+    permutation of 1,...,n for a positive integer n.
+    returns the 0-based images as array
+    '''
+    if not (isinstance(imagelist,list) or isinstance(imagelist,tuple)):
+        raise NoElementList(imagelist, "'is not a list or tuple")
+    # fast path: the array rejects items that are no integers or not positive,
+    # n distinct values in 0,...,n-1 are a permutation
+    try:
+        images=array(TYPECODE,[v-1 for v in imagelist])
+    except (TypeError,OverflowError):
+        images=None
+    if images is not None and len(set(images))==len(images) and (not images or max(images)==len(images)-1):
+        return(images)
+    _imagelist_error(imagelist)
+
+def _imagelist_error(imagelist):
+    # finds the error of an invalid imagelist in a single pass and raises it
+    n=len(imagelist)
+    # seen[v-1] is set if the value v in 1,...,n was found, values above n cannot be valid
+    seen=bytearray(n)
+    large=set()
+    duplicate=None
+    for v in imagelist:
+        if not isinstance(v,int):
+            raise InvalidItem(imagelist, "'%s' is not an integer"%v)
+        if v<=0:
+            raise InvalidItem(imagelist, "'%d' is not a positive integer"%v)
+        if v>n:
+            if v in large and (duplicate is None or v<duplicate):
+                duplicate=v
+            large.add(v)
+        elif seen[v-1]:
+            if duplicate is None or v<duplicate:
+                duplicate=v
+        else:
+            seen[v-1]=1
+    if duplicate is not None:
+        raise DuplicateElement(imagelist, "duplicate value '%d'"%duplicate)
+    raise MissingElement(imagelist, "'missing value %d"%(seen.index(0)+1))
+
+@instrumented('check_cyclelist')
+def check_cyclelist(cyclelist):
+    ''' 
+    checks if input is a valid cycle list.
+    an list or tuple is a valid cycle list if is a list or tuple
+    of cyclelist. A cyle is a list or tupble of positive integers
+    to cycles mcannot have a number in common.
+    returns the 0-based images as array
+    '''
+    if not (isinstance(cyclelist,list) or isinstance(cyclelist,tuple)):
+        raise NoElementList(cyclelist, "'is not a list or tuple")
+    # fast path as in check_imagelist, the points of all cycles must be distinct
+    points=None
+    if all((isinstance(cycle,list) or isinstance(cycle,tuple)) and cycle for cycle in cyclelist):
+        try:
+            points=array(TYPECODE,[e-1 for cycle in cyclelist for e in cycle])
+        except (TypeError,OverflowError):
+            pass
+    if points is None or len(set(points))!=len(points):
+        _cyclelist_error(cyclelist)
+    images=array(TYPECODE,range(max(points)+1 if points else 0))
+    for cycle in cyclelist:
+        p=cycle[-1]
+        for e in cycle:
+            images[p-1]=e-1
+            p=e
+    return(images)
+
+def _cyclelist_error(cyclelist):
+    # finds the error of an invalid cyclelist in a single pass and raises it
+    # seen[v-1] is set if the value v was found in a cycle
+    seen=bytearray()
+    duplicate=None
+    for cycle in cyclelist:
+        if not (isinstance(cycle,list) or isinstance(cycle,tuple)):
+            raise InvalidItem(cyclelist, "'%s' is not a list or tuple"%(cycle))
+        if cycle==[] or cycle==():
+            raise InvalidItem(cyclelist,"'%s' is an empty  list or tuple"%(str(cycle)))
+        for item in cycle:
+            if not isinstance(item,int):
+                raise InvalidItem(cyclelist,"'%s' is not an integer"%(item))
+            elif item<=0:
+                raise InvalidItem(cyclelist,"'%s' not a positive integer"%(item))
+            elif item>MAXPOINT:
+                raise InvalidItem(cyclelist,"'%s' is larger than %d"%(item,MAXPOINT))
+            if item>len(seen):
+                seen.extend(bytes(item-len(seen)))
+            if seen[item-1]:
+                if duplicate is None or item<duplicate:
+                    duplicate=item
+            seen[item-1]=1
+    if duplicate is None:
+        raise InvalidItem(cyclelist,"is not a valid cycle list")
+    invalidlist=[]
+    for cycle in cyclelist:
+        if duplicate in cycle:
+            invalidlist.append(cycle)
+    raise DuplicateElement(cyclelist,"the cycles %s contain the duplicate value %s"%(invalidlist,duplicate))
+    # is_cyclelist([[1, 2, 3], [11, 8, 9, 7], [4, 5]])
+
+def to_permutation(*args):
+    '''
+    convert the arguments to a permutation
+    args are some integers, then the list of these integers should be interpreted as imagelist
+    if args are some lists or tuples of integers, than these lists or tuples should be interpreted as check_cyclelist'''
+    if not args:
+        # empy to_permutation
+        return(from_image([]))
+    if isinstance(args[0],int):
+        return Permutation(check_imagelist(args))
+    if isinstance(args[0],list) or isinstance(args[0],tuple):
+        return Permutation(check_cyclelist(args))
+    raise InvalidItem(args,"invalid item '%s')%str(args[0])")
+
+##############################################
+#### Bulk input ##############################
+##############################################
+
+def _integers(items, line):
+    try:
+        return([int(item) for item in items])
+    except ValueError:
+        for item in items:
+            try:
+                int(item)
+            except ValueError:
+                raise InvalidItem(line,"'%s' is not an integer"%item) from None
+
+def parse_permutation(line):
+    '''
+    converts one line of text to the 0-based images of a permutation.
+    the line is either in cycle notation, e.g. "(1 2 3)(5 6)", "()" is the identity,
+    or an image list, e.g. "2 3 1 4", items can be separated by blanks or commas.
+    raises the same errors as check_cyclelist and check_imagelist, 'expression' is the line
+    '''
+    text=line.strip()
+    if not text.startswith('('):
+        images=_integers(text.replace(',',' ').split(),line)
+        if not images:
+            raise NoElementList(line,"'is not a list or tuple")
+        try:
+            return(check_imagelist(images))
+        except (InvalidItem,DuplicateElement,MissingElement) as error:
+            raise type(error)(line,error.message) from None
+    if not text.endswith(')'):
+        raise InvalidItem(line,"missing closing ')'")
+    if text[1:-1].strip()=='':
+        return(array(TYPECODE))
+    cycles=[]
+    for part in text[:-1].split(')'):
+        part=part.strip()
+        if not part.startswith('(') or '(' in part[1:]:
+            raise InvalidItem(line,"'%s' is not a cycle"%part)
+        cycles.append(tuple(_integers(part[1:].replace(',',' ').split(),line)))
+    try:
+        return(check_cyclelist(cycles))
+    except (InvalidItem,DuplicateElement) as error:
+        raise type(error)(line,error.message) from None
+
+def _lines(source):
+    if isinstance(source,(bytes,bytearray,memoryview)):
+        source=bytes(source).decode('ascii')
+    if isinstance(source,str):
+        source=source.splitlines()
+    for line in source:
+        if isinstance(line,(bytes,bytearray)):
+            line=line.decode('ascii')
+        yield line
+
+def iter_parse(source):
+    '''
+    yields the permutations of 'source', one per non-empty line.
+    'source' is a string, a bytes buffer or an iterable of lines like an open file,
+    it is read one line at a time. see parse_permutation for the format of the lines
+    '''
+    for line in _lines(source):
+        if line.strip():
+            yield Permutation(parse_permutation(line))
+
+def parse_many(source, batch=False, degree=None):
+    '''
+    input:
+        'source':
+            a string, a bytes buffer or an iterable of lines, one permutation per line
+        'batch':
+            if True a numpy batch is returned instead of a list of permutations
+        'degree':
+            the degree of the batch, the largest degree of the permutations if None
+    output:
+        return:
+            the list of the permutations or their batch
+    '''
+    if not batch:
+        return(list(iter_parse(source)))
+    from .batch import require_numpy
+    np=require_numpy()
+    rows=[(line,parse_permutation(line)) for line in _lines(source) if line.strip()]
+    if degree is None:
+        degree=max((len(row) for line,row in rows),default=0)
+    result=np.tile(np.arange(degree,dtype=np.uint32),(len(rows),1))
+    for k,(line,row) in enumerate(rows):
+        if len(row)>degree:
+            # trailing fixed points beyond 'degree' are allowed
+            row=Permutation(row)._images
+            if len(row)>degree:
+                raise InvalidItem(line,"moves the point %d, the degree of the batch is %d"%(len(row),degree))
+        result[k,:len(row)]=np.frombuffer(row,dtype=np.uint32)
+    return(result)